@@ -1,10 +1,8 @@
-"""Example script demonstrating programmatic use of moltbot-repo-scout."""
-import os
-import sys
-from pathlib import Path
+"""Example script demonstrating programmatic use of moltbot-repo-scout.
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+Requires the package to be installed first: ``pip install -e .``
+"""
+import os
 
 from moltbot_scout.config import Config
 from moltbot_scout.discovery import RepoDiscovery
@@ -38,7 +36,7 @@ def main():
     
     # Search for repositories
     print("🔍 Searching for repositories...")
-    repos = discovery.discover(['trading bot python stars:>50'])
+    repos = list(discovery.discover(['trading bot python stars:>50']))
     print(f"Found {len(repos)} repositories\n")
     
     # Analyze first repository as example
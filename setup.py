@@ -31,9 +31,25 @@ setup(
         "PyYAML>=6.0",
         "click>=8.1.0",
         "requests>=2.28.0",
-        "gitpython>=3.1.0",
+        "orjson>=3.8.0",
     ],
     extras_require={
+        "re2": [
+            "google-re2>=1.0",
+        ],
+        "aho": [
+            "pyahocorasick>=2.0",
+        ],
+        "numpy": [
+            "numpy>=1.22",
+        ],
+        "numba": [
+            "numba>=0.57",
+            "numpy>=1.22",
+        ],
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,14 +1,15 @@
 """Command-line interface for moltbot-repo-scout."""
 import click
+import hashlib
+import multiprocessing
 import os
-import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Dict, Any, Optional
 
 from moltbot_scout.config import Config
-from moltbot_scout.discovery import RepoDiscovery
+from moltbot_scout.discovery import RepoDiscovery, AsyncRepoDiscovery
 from moltbot_scout.scoring import RepoScorer
 from moltbot_scout.cloner import SafeCloner
 from moltbot_scout.security import SecurityScanner
@@ -17,6 +18,116 @@ from moltbot_scout.normalizer import SpecNormalizer
 from moltbot_scout.indexer import ArtifactIndexer
 
 
+# Per-process analysis components, built once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(cfg_dict: Dict[str, Any]):
+    """Build analysis components in a worker process.
+    
+    Args:
+        cfg_dict: Loaded configuration dictionary (Config.config)
+    """
+    cfg = Config.from_dict(cfg_dict)
+    compiled_patterns = cfg.compiled_security_patterns
+    # Already one repository per process; don't nest a second pool
+    _WORKER['scanner'] = SecurityScanner(
+        secret_patterns=compiled_patterns['secret'],
+        suspicious_patterns=compiled_patterns['suspicious'],
+        pattern_unions=cfg.compiled_security_unions,
+        re2_incompatible_patterns=cfg.get('security.re2_incompatible_patterns'),
+        scan_timeout=cfg.get('security.scan_timeout', 2),
+        max_workers=1,
+        max_file_size=cfg.get('security.max_file_size', 1048576),
+        # Read as-is: an explicit null disables the limit
+        max_findings_per_file=cfg.get('security', {}).get('max_findings_per_file', 100)
+    )
+    _WORKER['parser'] = StrategyParser(max_file_size=cfg.get('parser.max_file_size'),
+                                       max_workers=1,
+                                       cache_path=cfg.get('parser.cache_path'),
+                                       cache_size=cfg.get('parser.cache_size', 50000),
+                                       parse_tests=cfg.get('parser.parse_tests', True))
+    _WORKER['normalizer'] = SpecNormalizer()
+    _WORKER['art_dir'] = Path(cfg.get('output.artifacts_dir'))
+    _WORKER['compact_specs'] = cfg.get('output.compact_specs', True)
+    _WORKER['compress_specs'] = cfg.get('output.compress_specs', False)
+
+
+def _analyze_one(repo: Dict[str, Any], score_info: Dict[str, Any], repo_path: str) -> Dict[str, Any]:
+    """Scan, parse and save artifacts for one cloned repository.
+    
+    Runs in a worker process set up by _init_worker; module-level so it can
+    be pickled.
+    
+    Args:
+        repo: Repository information dictionary
+        score_info: Result of RepoScorer.score_repository for the repository
+        repo_path: Path to the cloned repository
+        
+    Returns:
+        Dictionary with the spec, artifact paths and progress lines to print
+    """
+    scanner = _WORKER['scanner']
+    parser = _WORKER['parser']
+    normalizer = _WORKER['normalizer']
+    lines = []
+    
+    # Security scan
+    lines.append(f"   Running security scan...")
+    security_info = scanner.scan_repository(repo_path)
+    lines.append(f"   Security: {security_info['total_issues']} issues found")
+    
+    # Parse code
+    lines.append(f"   Parsing code...")
+    parsed_info = parser.parse_repository(repo_path)
+    lines.append(f"   Found: {len(parsed_info['strategies'])} strategies, "
+                 f"{len(parsed_info['indicators'])} indicators")
+    
+    # Normalize and save
+    spec = normalizer.normalize(repo, score_info, security_info, parsed_info)
+    
+    # Save artifacts
+    safe_name = repo['full_name'].replace('/', '_')
+    shard = hashlib.sha1(safe_name.encode()).hexdigest()[:2]
+    spec_dir = _WORKER['art_dir'] / shard
+    spec_path = str(spec_dir / f"{safe_name}.json")
+    doc_path = str(spec_dir / f"{safe_name}.md")
+    
+    spec_path = normalizer.save_spec(spec, spec_path,
+                                     compact=_WORKER['compact_specs'],
+                                     compress=_WORKER['compress_specs'])
+    normalizer.save_markdown_doc(spec, doc_path)
+    
+    lines.append(f"   ✅ Analysis complete\n")
+    
+    return {
+        'name': repo['full_name'],
+        'spec': spec,
+        'spec_path': spec_path,
+        'doc_path': doc_path,
+        'lines': lines,
+    }
+
+
+def _search_cache_path(cfg: Config) -> Optional[str]:
+    """Resolve the search cache path from configuration.
+    
+    A relative github.cache_path is taken from output.artifacts_dir, so the
+    cache lives next to the run's outputs rather than in whatever directory
+    the command was started from.
+    
+    Args:
+        cfg: Loaded configuration
+        
+    Returns:
+        Path of the SQLite cache file, or None if caching is disabled
+    """
+    cache_path = cfg.get('github.cache_path')
+    if not cache_path:
+        return None
+    return os.path.join(cfg.get('output.artifacts_dir', 'artifacts'), os.path.expanduser(cache_path))
+
+
 @click.group()
 @click.version_option(version='0.1.0')
 def main():
@@ -30,8 +141,14 @@ def main():
 @click.option('--query', '-q', multiple=True, help='Search query (can be specified multiple times)')
 @click.option('--max-results', '-m', type=int, default=5, help='Maximum results per query')
 @click.option('--min-score', '-s', type=float, default=0.3, help='Minimum trustworthiness score')
+@click.option('--max-clones', type=int, help='Maximum repositories to clone and analyze')
 @click.option('--cleanup/--no-cleanup', default=True, help='Clean up cloned repos after analysis')
-def discover(config, token, query, max_results, min_score, cleanup):
+@click.option('--async-discovery', is_flag=True, default=False,
+              help='Run search queries concurrently (requires aiohttp)')
+@click.option('--workers', '-w', type=int, default=None,
+              help='Analysis worker processes (default: CPU count)')
+def discover(config, token, query, max_results, min_score, max_clones, cleanup,
+             async_discovery, workers):
     """Discover and analyze GitHub repositories."""
     click.echo("🔍 Starting repository discovery...\n")
     
@@ -51,98 +168,126 @@ def discover(config, token, query, max_results, min_score, cleanup):
     if min_score:
         cfg.set('scoring.min_score', min_score)
     
+    if max_clones:
+        cfg.set('scoring.max_clones', max_clones)
+    
     # Initialize components
-    discovery = RepoDiscovery(
-        github_token=cfg.get('github.token'),
-        max_results_per_query=cfg.get('github.max_results_per_query')
-    )
+    if async_discovery:
+        discovery = AsyncRepoDiscovery(
+            github_token=cfg.get('github.token'),
+            max_results_per_query=cfg.get('github.max_results_per_query')
+        )
+    else:
+        discovery = RepoDiscovery(
+            github_token=cfg.get('github.token'),
+            max_results_per_query=cfg.get('github.max_results_per_query'),
+            cache_path=_search_cache_path(cfg),
+            cache_ttl=cfg.get('github.cache_ttl', 21600)
+        )
     scorer = RepoScorer(weights=cfg.get('scoring.weights'))
     cloner = SafeCloner(
         clone_dir=cfg.get('cloner.clone_dir'),
         max_depth=cfg.get('cloner.max_depth'),
         timeout=cfg.get('cloner.timeout')
     )
-    scanner = SecurityScanner(
-        secret_patterns=cfg.get('security.secret_patterns'),
-        suspicious_patterns=cfg.get('security.suspicious_patterns')
-    )
-    parser = StrategyParser(max_file_size=cfg.get('parser.max_file_size'))
-    normalizer = SpecNormalizer()
     indexer = ArtifactIndexer(
         artifacts_dir=cfg.get('output.artifacts_dir'),
         index_file=cfg.get('output.index_file')
     )
     
-    # Discover repositories
-    click.echo("Searching for repositories...")
-    repos = discovery.discover(cfg.get('github.search_queries'))
-    click.echo(f"Found {len(repos)} repositories\n")
+    art_dir = Path(cfg.get('output.artifacts_dir'))
+    
+    # Discover repositories, then score the whole set in one batch
+    click.echo("Searching for repositories...\n")
+    
+    if async_discovery:
+        repos = list(discovery.discover_sync(cfg.get('github.search_queries')))
+    else:
+        with discovery:
+            repos = list(discovery.discover(cfg.get('github.search_queries')))
     
     analyzed_count = 0
+    scored = []
     
-    for repo in repos:
-        click.echo(f"📦 Analyzing: {repo['full_name']}")
+    for repo, score_info in zip(repos, scorer.score_repositories(repos)):
+        # One write per repository instead of one per status line
+        lines = [f"📦 Scoring: {repo['full_name']}"]
+        append = lines.append
         
-        # Score repository
-        score_info = scorer.score_repository(repo)
-        click.echo(f"   Trust Score: {score_info['overall_score']} ({score_info['trustworthiness']})")
+        append(f"   Trust Score: {score_info['overall_score']} ({score_info['trustworthiness']})")
         
         # Check minimum score
         if score_info['overall_score'] < cfg.get('scoring.min_score'):
-            click.echo(f"   ⚠️  Score below minimum threshold, skipping\n")
-            continue
-        
-        # Clone repository
-        click.echo(f"   Cloning repository...")
-        clone_result = cloner.clone_repository(repo['clone_url'], repo['full_name'])
-        
-        if not clone_result['success']:
-            click.echo(f"   ❌ Clone failed: {clone_result['message']}\n")
-            continue
-        
-        repo_path = clone_result['path']
-        
-        # Security scan
-        click.echo(f"   Running security scan...")
-        security_info = scanner.scan_repository(repo_path)
-        click.echo(f"   Security: {security_info['total_issues']} issues found")
+            append(f"   ⚠️  Score below minimum threshold, skipping\n")
+        else:
+            append("")
+            scored.append((score_info, repo))
         
-        # Parse code
-        click.echo(f"   Parsing code...")
-        parsed_info = parser.parse_repository(repo_path)
-        click.echo(f"   Found: {len(parsed_info['strategies'])} strategies, "
-                  f"{len(parsed_info['indicators'])} indicators")
-        
-        # Normalize and save
-        spec = normalizer.normalize(repo, score_info, security_info, parsed_info)
-        
-        # Save artifacts
-        safe_name = repo['full_name'].replace('/', '_')
-        spec_path = os.path.join(cfg.get('output.artifacts_dir'), f"{safe_name}.json")
-        doc_path = os.path.join(cfg.get('output.artifacts_dir'), f"{safe_name}.md")
-        
-        normalizer.save_spec(spec, spec_path)
-        normalizer.save_markdown_doc(spec, doc_path)
+        click.echo('\n'.join(lines))
+    
+    # Cloning is by far the most expensive step: spend it on the best
+    # repositories only
+    scored.sort(key=lambda x: x[0]['overall_score'], reverse=True)
+    max_clones = cfg.get('scoring.max_clones')
+    if max_clones and len(scored) > max_clones:
+        click.echo(f"Cloning the top {max_clones} of {len(scored)} repositories above threshold\n")
+        scored = scored[:max_clones]
+    
+    scores = {repo['full_name']: score_info for score_info, repo in scored}
+    
+    # Clones run ahead in the background while earlier repositories are analyzed
+    clones = cloner.clone_many([repo for _, repo in scored],
+                               max_workers=cfg.get('cloner.max_workers', 4))
+    
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    
+    def finish(future):
+        result = future.result()
+        click.echo('\n'.join([f"📦 Analyzing: {result['name']}"] + result['lines']))
         
         # Add to index
-        indexer.add_repository(repo['full_name'], spec, spec_path, doc_path)
-        
-        click.echo(f"   ✅ Analysis complete\n")
-        analyzed_count += 1
+        indexer.add_repository(result['name'], result['spec'],
+                               result['spec_path'], result['doc_path'])
         
         # Cleanup
         if cleanup:
-            cloner.cleanup_repository(repo['full_name'])
+            cloner.cleanup_repository(result['name'])
+    
+    # Scanning and parsing are CPU-bound and independent per repository, so
+    # they run in worker processes; only indexing happens here. Workers are
+    # spawned rather than forked: a fork while a clone thread is starting git
+    # would leak that thread's exec pipe into the worker and hang the clone.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cfg.config,),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        for repo, clone_result in clones:
+            if not clone_result['success']:
+                click.echo(f"📦 Analyzing: {repo['full_name']}\n"
+                           f"   ❌ Clone failed: {clone_result['message']}\n")
+                continue
+            
+            pending.append(executor.submit(
+                _analyze_one, repo, scores[repo['full_name']], clone_result['path']
+            ))
+            
+            # Keep at most one queued repository per worker on disk
+            if len(pending) >= workers:
+                finish(pending.popleft())
+                analyzed_count += 1
+        
+        while pending:
+            finish(pending.popleft())
+            analyzed_count += 1
     
     # Generate index report
-    report_path = os.path.join(cfg.get('output.artifacts_dir'), 'INDEX.md')
-    with open(report_path, 'w') as f:
-        f.write(indexer.generate_index_report())
+    (art_dir / 'INDEX.md').write_text(indexer.generate_index_report())
+    indexer.close()
     
-    click.echo(f"\n✨ Discovery complete!")
-    click.echo(f"Analyzed {analyzed_count} repositories")
-    click.echo(f"Results saved to: {cfg.get('output.artifacts_dir')}")
-    click.echo(f"Index: {cfg.get('output.index_file')}")
+    click.echo(f"\n✨ Discovery complete!\n"
+               f"Analyzed {analyzed_count} repositories\n"
+               f"Results saved to: {art_dir}\n"
+               f"Index: {cfg.get('output.index_file')}")
 
 
 @main.command()
@@ -158,18 +303,37 @@ def init_config(config):
     click.echo(f"✅ Configuration file created: {config}")
 
 
+@main.command()
+@click.option('--config', '-c', type=click.Path(), help='Path to config file')
+def clear_cache(config):
+    """Clear cached GitHub search results."""
+    cfg = Config(config) if config else Config()
+    cache_path = _search_cache_path(cfg)
+    
+    if not cache_path or not os.path.exists(cache_path):
+        click.echo("No search cache to clear")
+        return
+    
+    with RepoDiscovery(cache_path=cache_path) as discovery:
+        discovery.clear_cache()
+    click.echo(f"✅ Search cache cleared: {cache_path}")
+
+
 @main.command()
 @click.option('--artifacts-dir', '-a', type=click.Path(), default='artifacts',
               help='Artifacts directory')
 def stats(artifacts_dir):
     """Show statistics from indexed repositories."""
-    index_file = os.path.join(artifacts_dir, 'index.json')
+    index_file = Path(artifacts_dir) / 'index.json'
     
-    if not os.path.exists(index_file):
+    # The indexer also replays a delta log left by a run that never compacted
+    indexer = None
+    if Path(artifacts_dir).is_dir():
+        indexer = ArtifactIndexer(artifacts_dir=artifacts_dir, index_file=str(index_file))
+    if indexer is None or not indexer.exists:
         click.echo(f"❌ Index file not found: {index_file}")
         return
     
-    indexer = ArtifactIndexer(artifacts_dir=artifacts_dir, index_file=index_file)
     stats = indexer.get_stats()
     
     click.echo("\n📊 Repository Statistics\n")
@@ -186,23 +350,26 @@ def stats(artifacts_dir):
 @click.option('--max-issues', '-i', type=int, help='Maximum security issues')
 def list_repos(artifacts_dir, min_score, max_issues):
     """List indexed repositories with optional filtering."""
-    index_file = os.path.join(artifacts_dir, 'index.json')
+    index_file = Path(artifacts_dir) / 'index.json'
     
-    if not os.path.exists(index_file):
+    # The indexer also replays a delta log left by a run that never compacted
+    indexer = None
+    if Path(artifacts_dir).is_dir():
+        indexer = ArtifactIndexer(artifacts_dir=artifacts_dir, index_file=str(index_file))
+    if indexer is None or not indexer.exists:
         click.echo(f"❌ Index file not found: {index_file}")
         return
     
-    indexer = ArtifactIndexer(artifacts_dir=artifacts_dir, index_file=index_file)
     repos = indexer.get_repositories(min_score=min_score, max_security_issues=max_issues)
     
     click.echo(f"\n📚 Found {len(repos)} repositories\n")
     
     for repo in sorted(repos, key=lambda x: x['trustworthiness_score'], reverse=True):
-        click.echo(f"• {repo['name']}")
-        click.echo(f"  Score: {repo['trustworthiness_score']} ({repo['trustworthiness_level']})")
-        click.echo(f"  Security: {repo['security_issues']} issues")
-        click.echo(f"  Strategies: {repo['strategies_count']}, Indicators: {repo['indicators_count']}")
-        click.echo(f"  Spec: {repo['spec_path']}\n")
+        click.echo(f"• {repo['name']}\n"
+                   f"  Score: {repo['trustworthiness_score']} ({repo['trustworthiness_level']})\n"
+                   f"  Security: {repo['security_issues']} issues\n"
+                   f"  Strategies: {repo['strategies_count']}, Indicators: {repo['indicators_count']}\n"
+                   f"  Spec: {repo['spec_path']}\n")
 
 
 if __name__ == '__main__':
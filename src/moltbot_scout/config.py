@@ -1,7 +1,31 @@
 """Configuration management for moltbot-repo-scout."""
+import copy
+import functools
 import os
+import re
 import yaml
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Pattern, Tuple
+
+from moltbot_scout.security import build_pattern_union
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file, memoized on its path and modification stamp.
+    
+    Args:
+        path: Absolute path to the config file
+        mtime_ns: File modification time (part of the cache key)
+        size: File size in bytes (part of the cache key)
+        
+    Returns:
+        Parsed configuration dictionary (shared; callers must copy it)
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
 
 
 class Config:
@@ -20,12 +44,40 @@ class Config:
         
         self.config_path = config_path
         self.config = self._load_config()
+        self._flat: Dict[str, Any] = {}
+        self._flatten(self.config)
+        self._compiled_sec = None
+        self._compiled_unions = None
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], config_path: str = None) -> 'Config':
+        """Build a configuration from an already-loaded dictionary.
+        
+        Used to hand configuration to worker processes without re-reading
+        files: only the plain dictionary needs to be pickled.
+        
+        Args:
+            config: Configuration dictionary (e.g. another Config's ``config``)
+            config_path: Path used by save() when called without a path
+            
+        Returns:
+            Config instance wrapping ``config``
+        """
+        self = cls.__new__(cls)
+        self.config_path = config_path
+        self.config = config
+        self._flat = {}
+        self._flatten(self.config)
+        self._compiled_sec = None
+        self._compiled_unions = None
+        return self
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+            path = os.path.abspath(self.config_path)
+            st = os.stat(path)
+            return copy.deepcopy(_read_config_file(path, st.st_mtime_ns, st.st_size))
         return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
@@ -40,6 +92,8 @@ class Config:
                     'algorithmic trading bot'
                 ],
                 'max_results_per_query': 20,
+                'cache_path': '.scout_cache.sqlite',
+                'cache_ttl': 21600,  # 6 hours
             },
             'scoring': {
                 'weights': {
@@ -49,20 +103,22 @@ class Config:
                     'license': 0.15,
                     'activity': 0.15
                 },
-                'min_score': 0.3
+                'min_score': 0.3,
+                'max_clones': 20
             },
             'cloner': {
                 'clone_dir': 'data/repos',
                 'max_depth': 1,
-                'timeout': 300
+                'timeout': 300,
+                'max_workers': 4
             },
             'security': {
                 'scan_secrets': True,
                 'scan_patterns': True,
                 'secret_patterns': [
-                    r'(?i)(api[_-]?key|apikey)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,}[\'"]',
-                    r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*[\'"][^\'"]{8,}[\'"]',
-                    r'(?i)(token|auth)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,}[\'"]',
+                    r'(?i)(api[_-]?key|apikey)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,256}[\'"]',
+                    r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*[\'"][^\'"\n]{8,256}[\'"]',
+                    r'(?i)(token|auth)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,256}[\'"]',
                 ],
                 'suspicious_patterns': [
                     r'eval\s*\(',
@@ -70,21 +126,67 @@ class Config:
                     r'__import__\s*\(',
                     r'subprocess\.',
                     r'os\.system\s*\(',
-                ]
+                ],
+                # Patterns RE2 cannot run (backreferences, lookaround); listing
+                # one here keeps the scan on the stdlib engine
+                're2_incompatible_patterns': [],
+                # Per-file time limit (seconds) when scanning with the stdlib engine
+                'scan_timeout': 2,
+                'max_file_size': 1048576,  # 1MB
+                'max_findings_per_file': 100,
             },
             'parser': {
                 'file_extensions': ['.py'],
                 'max_file_size': 1048576,  # 1MB
+                'parse_tests': True,
+                'cache_path': None,  # Parse cache off unless configured
+                'cache_size': 50000,
                 'extract_strategies': True,
                 'extract_indicators': True,
                 'extract_risk_logic': True
             },
             'output': {
                 'artifacts_dir': 'artifacts',
-                'index_file': 'artifacts/index.json'
+                'index_file': 'artifacts/index.json',
+                'compact_specs': True,
+                'compress_specs': False
             }
         }
     
+    @property
+    def compiled_security_patterns(self) -> Dict[str, List[Pattern]]:
+        """Security regex patterns, compiled once and reused.
+        
+        Returns:
+            Dictionary with 'secret' and 'suspicious' lists of compiled patterns
+        """
+        if self._compiled_sec is None:
+            self._compiled_sec = {
+                'secret': [re.compile(p) for p in self.get('security.secret_patterns', [])],
+                'suspicious': [re.compile(p) for p in self.get('security.suspicious_patterns', [])],
+            }
+        return self._compiled_sec
+    
+    @property
+    def compiled_security_unions(self) -> Dict[str, Tuple[Pattern, List[Tuple[str, str]]]]:
+        """Security patterns fused into one alternation per category, built once.
+        
+        Categories without configured patterns are left out; SecurityScanner
+        builds their unions from its default patterns.
+        
+        Returns:
+            Dictionary mapping 'secret' and 'suspicious' to (union pattern,
+            pattern_meta), where pattern_meta maps the group index of each
+            ``p<index>`` group to (kind, original regex)
+        """
+        if self._compiled_unions is None:
+            self._compiled_unions = {
+                kind: build_pattern_union([(kind, p) for p in patterns])
+                for kind, patterns in self.compiled_security_patterns.items()
+                if patterns
+            }
+        return self._compiled_unions
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated key.
         
@@ -95,17 +197,24 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-            if value is None:
-                return default
+        value = self._flat.get(key)
+        if value is None:
+            return default
         return value
     
+    def _flatten(self, d: Dict[str, Any], prefix: str = ''):
+        """Index every node of the config tree under its dot-separated key.
+        
+        Args:
+            d: Config (sub)tree to index
+            prefix: Dot-separated key of ``d`` including the trailing dot
+        """
+        for k, v in d.items():
+            key = f'{prefix}{k}'
+            self._flat[key] = v
+            if isinstance(v, dict):
+                self._flatten(v, f'{key}.')
+    
     def set(self, key: str, value: Any):
         """Set configuration value by dot-separated key.
         
@@ -120,6 +229,13 @@ class Config:
                 config[k] = {}
             config = config[k]
         config[keys[-1]] = value
+        
+        self._flat = {}
+        self._flatten(self.config)
+        
+        if keys[0] == 'security':
+            self._compiled_sec = None
+            self._compiled_unions = None
     
     def save(self, path: str = None):
         """Save configuration to file.
@@ -1,83 +1,267 @@
 """GitHub repository discovery module."""
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from github import Github, GithubException
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
 import time
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 class RepoDiscovery:
-    """Discovers GitHub repositories related to Moltbot and trading bots."""
+    """Discovers GitHub repositories related to Moltbot and trading bots.
+    
+    Holds the search cache's SQLite connection open until close(); use it as
+    a context manager to release it.
+    """
     
-    def __init__(self, github_token: str = None, max_results_per_query: int = 20):
+    def __init__(self, github_token: str = None, max_results_per_query: int = 20,
+                 cache_path: str = '.scout_cache.sqlite', cache_ttl: int = 6 * 60 * 60,
+                 max_workers: int = 5, max_retries: int = 3, overlap_threshold: float = 0.8):
         """Initialize repository discovery.
         
         Args:
             github_token: GitHub API token for authentication
             max_results_per_query: Maximum results per search query
+            cache_path: SQLite file caching search results between runs (None disables caching)
+            cache_ttl: Age in seconds after which cached results are refetched
+            max_workers: Maximum concurrent API requests when extracting repository details
+            max_retries: Retries with backoff when GitHub rate-limits a search
+            overlap_threshold: Fraction of already-seen repositories on a query's
+                first page above which its remaining pages are skipped
         """
         self.github = Github(github_token) if github_token else Github()
         self.max_results_per_query = max_results_per_query
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.overlap_threshold = overlap_threshold
+        self.cache_ttl = cache_ttl
+        self._cache = None
+        
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+            self._cache = sqlite3.connect(cache_path)
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS discover_cache'
+                '(key TEXT PRIMARY KEY, ts INTEGER, payload BLOB)'
+            )
+            self._cache.commit()
     
-    def discover(self, search_queries: List[str]) -> List[Dict[str, Any]]:
+    def discover(self, search_queries: List[str]) -> Iterator[Dict[str, Any]]:
         """Discover repositories based on search queries.
         
+        Repositories are yielded as each query returns, so callers can start
+        working on early results while later queries are still in flight.
+        
         Args:
             search_queries: List of search query strings
             
-        Returns:
-            List of repository information dictionaries
+        Yields:
+            Repository information dictionaries, each repository once
         """
-        discovered_repos = []
-        seen_repos = set()
+        # full_name -> extracted info, reused when later queries return the same repo
+        seen_repos: Dict[str, Dict[str, Any]] = {}
         
         for query in search_queries:
             try:
-                repos = self._search_repos(query)
+                key = self._cache_key(query)
+                repos = self._cache_get(key)
+                
+                if repos is None:
+                    repos, truncated = self._search_repos(query, seen_repos)
+                    # A result cut short by overlap depends on earlier queries
+                    if repos and not truncated:
+                        self._cache_put(key, repos)
+                    
+                    # Rate limit handling
+                    self._wait_for_rate_limit()
+                
                 for repo in repos:
                     if repo['full_name'] not in seen_repos:
-                        seen_repos.add(repo['full_name'])
-                        discovered_repos.append(repo)
-                
-                # Rate limit handling
-                time.sleep(1)
+                        seen_repos[repo['full_name']] = repo
+                        yield repo
                 
             except GithubException as e:
                 print(f"Error searching for '{query}': {e}")
                 continue
+    
+    def close(self) -> None:
+        """Close the search cache connection."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    def __enter__(self) -> 'RepoDiscovery':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Remove all cached search results."""
+        if self._cache is not None:
+            self._cache.execute('DELETE FROM discover_cache')
+            self._cache.commit()
+    
+    def _cache_key(self, query: str) -> str:
+        """Build the cache key for a search query.
         
-        return discovered_repos
+        Args:
+            query: Search query string
+            
+        Returns:
+            Hex digest identifying the query and result limit
+        """
+        return hashlib.sha1(f'{query}|{self.max_results_per_query}'.encode()).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get cached search results if present and fresh.
+        
+        Args:
+            key: Cache key from _cache_key()
+            
+        Returns:
+            List of repository information dictionaries, or None on a miss
+        """
+        if self._cache is None:
+            return None
+        
+        row = self._cache.execute(
+            'SELECT ts, payload FROM discover_cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or time.time() - row[0] > self.cache_ttl:
+            return None
+        return json.loads(row[1])
+    
+    def _cache_put(self, key: str, repos: List[Dict[str, Any]]) -> None:
+        """Store search results in the cache.
+        
+        Args:
+            key: Cache key from _cache_key()
+            repos: List of repository information dictionaries
+        """
+        if self._cache is None:
+            return
+        
+        self._cache.execute(
+            'INSERT OR REPLACE INTO discover_cache (key, ts, payload) VALUES (?, ?, ?)',
+            (key, int(time.time()), json.dumps(repos))
+        )
+        self._cache.commit()
     
-    def _search_repos(self, query: str) -> List[Dict[str, Any]]:
+    def _search_repos(self, query: str,
+                      known: Dict[str, Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], bool]:
         """Search for repositories with given query.
         
+        Repositories already in ``known`` are not looked up again. If the first
+        page of results is mostly known repositories, later pages are skipped:
+        the query overlaps an earlier one and further pages would likely be
+        duplicates too.
+        
         Args:
             query: Search query string
+            known: Repository information already extracted, keyed by full name
             
         Returns:
-            List of repository information dictionaries
+            Tuple of (list of repository information dictionaries, whether the
+            results were cut short because of overlap)
         """
+        known = known or {}
+        # The first page holds per_page results, or fewer if that is more
+        # than the query asks for
+        page_size = min(getattr(self.github, 'per_page', 30), self.max_results_per_query)
         repos = []
-        try:
-            results = self.github.search_repositories(
-                query=query,
-                sort='stars',
-                order='desc'
-            )
-            
-            count = 0
-            for repo in results:
-                if count >= self.max_results_per_query:
-                    break
+        truncated = False
+        for attempt in range(self.max_retries + 1):
+            try:
+                results = self.github.search_repositories(
+                    query=query,
+                    sort='stars',
+                    order='desc'
+                )
+                
+                matches = []
+                truncated = False
+                for repo in results:
+                    if len(matches) >= self.max_results_per_query:
+                        break
+                    matches.append(repo)
+                    
+                    if len(matches) == page_size and known:
+                        overlap = sum(1 for m in matches if m.full_name in known)
+                        if overlap >= self.overlap_threshold * page_size:
+                            # Only a cut short result depends on earlier queries
+                            truncated = page_size < self.max_results_per_query
+                            break
                 
-                repos.append(self._extract_repo_info(repo))
-                count += 1
+                # Detail lookups (topics, license, owner) are separate round trips;
+                # run them concurrently for unseen repositories only
+                new_matches = [m for m in matches if m.full_name not in known]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    extracted = dict(zip(
+                        (m.full_name for m in new_matches),
+                        executor.map(self._extract_repo_info, new_matches)
+                    ))
+                repos = [known.get(m.full_name) or extracted[m.full_name] for m in matches]
+                break
                 
-        except GithubException as e:
-            error_msg = f"GitHub API error: {e.status}"
-            if hasattr(e, 'message'):
-                error_msg += f" - {e.message}"
-            print(error_msg)
+            except GithubException as e:
+                if e.status in (403, 429) and attempt < self.max_retries:
+                    time.sleep(self._retry_delay(e, attempt))
+                    continue
+                
+                error_msg = f"GitHub API error: {e.status}"
+                if hasattr(e, 'message'):
+                    error_msg += f" - {e.message}"
+                print(error_msg)
+                break
+        
+        return repos, truncated
+    
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep only when the search API budget is nearly used up.
+        
+        The remaining wait until the budget resets is spread over the requests
+        still available, so runs with headroom never pause.
+        """
+        try:
+            limits = self.github.get_rate_limit()
+        except GithubException:
+            return
+        
+        # PyGithub moved per-resource limits under .resources in newer releases
+        search = getattr(limits, 'search', None) or limits.resources.search
+        remaining = search.remaining
+        if remaining >= 2:
+            return
         
-        return repos
+        wait = max(0.0, search.reset.timestamp() - time.time()) / max(remaining, 1)
+        time.sleep(wait)
+    
+    def _retry_delay(self, error: GithubException, attempt: int) -> float:
+        """Get the delay before retrying a rate-limited request.
+        
+        Args:
+            error: The 403/429 error returned by GitHub
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Seconds to wait: the Retry-After header if given, else exponential backoff
+        """
+        for name, value in (getattr(error, 'headers', None) or {}).items():
+            if name.lower() == 'retry-after':
+                try:
+                    return float(value)
+                except ValueError:
+                    break
+        return float(2 ** attempt)
     
     def _extract_repo_info(self, repo) -> Dict[str, Any]:
         """Extract relevant information from repository object.
@@ -107,3 +291,146 @@ class RepoDiscovery:
             'size': repo.size,
             'open_issues': repo.open_issues_count,
         }
+
+
+class AsyncRepoDiscovery:
+    """Discovers repositories with concurrent requests to the GitHub search API.
+    
+    Requires the optional ``aiohttp`` package. The search response already
+    carries every field RepoDiscovery extracts (including topics), so each
+    query costs one request per results page and queries run concurrently.
+    """
+    
+    SEARCH_URL = 'https://api.github.com/search/repositories'
+    
+    def __init__(self, github_token: str = None, max_results_per_query: int = 20,
+                 max_concurrency: int = 5):
+        """Initialize async repository discovery.
+        
+        Args:
+            github_token: GitHub API token for authentication
+            max_results_per_query: Maximum results per search query
+            max_concurrency: Maximum number of requests in flight
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncRepoDiscovery requires aiohttp (pip install aiohttp)")
+        
+        self.github_token = github_token
+        self.max_results_per_query = max_results_per_query
+        self.max_concurrency = max_concurrency
+    
+    def discover_sync(self, search_queries: List[str]) -> List[Dict[str, Any]]:
+        """Run discover() to completion from synchronous code.
+        
+        Args:
+            search_queries: List of search query strings
+            
+        Returns:
+            List of repository information dictionaries
+        """
+        return asyncio.run(self.discover(search_queries))
+    
+    async def discover(self, search_queries: List[str]) -> List[Dict[str, Any]]:
+        """Discover repositories based on search queries.
+        
+        Args:
+            search_queries: List of search query strings
+            
+        Returns:
+            List of repository information dictionaries, in query order, each
+            repository once
+        """
+        headers = {'Accept': 'application/vnd.github+json'}
+        if self.github_token:
+            headers['Authorization'] = f'Bearer {self.github_token}'
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(headers=headers) as session:
+            results = await asyncio.gather(*(
+                self._search_repos(session, semaphore, query) for query in search_queries
+            ))
+        
+        discovered_repos = []
+        seen_repos = set()
+        for repos in results:
+            for repo in repos:
+                if repo['full_name'] not in seen_repos:
+                    seen_repos.add(repo['full_name'])
+                    discovered_repos.append(repo)
+        
+        return discovered_repos
+    
+    async def _search_repos(self, session, semaphore: asyncio.Semaphore,
+                            query: str) -> List[Dict[str, Any]]:
+        """Search for repositories with given query.
+        
+        Args:
+            session: Open aiohttp client session
+            semaphore: Semaphore bounding concurrent requests
+            query: Search query string
+            
+        Returns:
+            List of repository information dictionaries
+        """
+        per_page = min(self.max_results_per_query, 100)
+        items = []
+        page = 1
+        
+        while len(items) < self.max_results_per_query:
+            params = {'q': query, 'sort': 'stars', 'order': 'desc',
+                      'per_page': per_page, 'page': page}
+            try:
+                async with semaphore:
+                    async with session.get(self.SEARCH_URL, params=params) as resp:
+                        if resp.status != 200:
+                            print(f"GitHub API error: {resp.status} - {await resp.text()}")
+                            break
+                        payload = await resp.json()
+            except aiohttp.ClientError as e:
+                print(f"Error searching for '{query}': {e}")
+                break
+            
+            page_items = payload.get('items', [])
+            items.extend(page_items)
+            if len(page_items) < per_page:
+                break
+            page += 1
+        
+        return [self._extract_repo_info(item) for item in items[:self.max_results_per_query]]
+    
+    @staticmethod
+    def _extract_repo_info(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract relevant information from a search API result item.
+        
+        Args:
+            item: Repository object from the search API JSON response
+            
+        Returns:
+            Dictionary with repository information, shaped like RepoDiscovery's
+        """
+        def iso(value):
+            # Match datetime.isoformat() output used by RepoDiscovery
+            if value and value.endswith('Z'):
+                return value[:-1] + '+00:00'
+            return value
+        
+        license_info = item.get('license')
+        return {
+            'full_name': item['full_name'],
+            'name': item['name'],
+            'owner': item['owner']['login'],
+            'description': item.get('description'),
+            'url': item['html_url'],
+            'clone_url': item['clone_url'],
+            'stars': item.get('stargazers_count', 0),
+            'forks': item.get('forks_count', 0),
+            'created_at': iso(item.get('created_at')),
+            'updated_at': iso(item.get('updated_at')),
+            'pushed_at': iso(item.get('pushed_at')),
+            'language': item.get('language'),
+            'license': license_info['name'] if license_info else None,
+            'topics': item.get('topics', []),
+            'default_branch': item.get('default_branch'),
+            'size': item.get('size', 0),
+            'open_issues': item.get('open_issues_count', 0),
+        }
@@ -1,38 +1,115 @@
 """Artifact indexer module for organizing analyzed repositories."""
+import functools
+import gzip
 import json
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_UTC = timezone.utc
+
+
+@functools.lru_cache(maxsize=256)
+def _read_spec(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Load a saved spec file, memoized on its path and modification stamp.
+    
+    Args:
+        path: Path to the spec (.json or gzipped .json.gz)
+        mtime_ns: File modification time (part of the cache key)
+        size: File size in bytes (part of the cache key)
+        
+    Returns:
+        Specification dictionary (shared; callers must not modify it)
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 class ArtifactIndexer:
     """Indexes and organizes analyzed repository artifacts."""
     
-    def __init__(self, artifacts_dir: str = "artifacts", index_file: str = "artifacts/index.json"):
+    def __init__(self, artifacts_dir: str = "artifacts", index_file: str = "artifacts/index.json",
+                 compact_ratio: float = 1.0):
         """Initialize artifact indexer.
         
+        Additions are appended to a delta log next to the index file
+        (``<index_file>.log``) rather than rewriting the whole index; the log
+        is folded back into the index by compact().
+        
         Args:
             artifacts_dir: Directory to store artifacts
             index_file: Path to index file
+            compact_ratio: Compact once the log holds more entries than this
+                fraction of the indexed repositories
         """
         self.artifacts_dir = artifacts_dir
         self.index_file = index_file
+        self.log_file = index_file + '.log'
+        self.compact_ratio = compact_ratio
+        self._log = None
+        self._log_entries = 0
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        # Position of each repository in index['repositories']
+        self._slots: Dict[str, int] = {}
+        self._sorted_repos = None
+        # Whether an index (compacted file or pending log) was already on disk
+        self.exists = os.path.exists(index_file) or os.path.exists(self.log_file)
         os.makedirs(artifacts_dir, exist_ok=True)
         self.index = self._load_index()
     
     def _load_index(self) -> Dict[str, Any]:
-        """Load existing index or create new one."""
+        """Load existing index (plus pending log entries) or create new one.
+        
+        Repository entries are also held in ``self._by_name`` keyed by full
+        name, so additions and lookups don't scan index['repositories'].
+        """
+        index = self._load_base_index()
+        self._by_name = {r['name']: r for r in index.get('repositories', [])}
+        self._slots = {name: slot for slot, name in enumerate(self._by_name)}
+        index['repositories'] = list(self._by_name.values())
+        index['stats'] = self._compute_stats(self._by_name.values())
+        
+        if os.path.exists(self.log_file):
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn final write; everything before it is intact
+                    if record.get('op') == 'upsert':
+                        self._upsert(index, record['entry'])
+                        index['updated_at'] = record['entry']['added_at']
+                        self._log_entries += 1
+        
+        return index
+    
+    def _load_base_index(self) -> Dict[str, Any]:
+        """Load the compacted index file or create a new index.
+        
+        Raises:
+            json.JSONDecodeError: If the index file is not valid JSON. save_index()
+                replaces the file atomically, so this indicates real corruption
+                rather than an interrupted write.
+        """
         if os.path.exists(self.index_file):
-            try:
-                with open(self.index_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading index: {e}")
+            with open(self.index_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         
+        now = datetime.now(_UTC).isoformat()
         return {
             'version': '1.0',
-            'created_at': datetime.now(timezone.utc).isoformat(),
-            'updated_at': datetime.now(timezone.utc).isoformat(),
+            'created_at': now,
+            'updated_at': now,
             'repositories': [],
             'stats': {
                 'total_repositories': 0,
@@ -52,9 +129,6 @@ class ArtifactIndexer:
             spec_path: Path to JSON spec file
             doc_path: Path to markdown doc file
         """
-        # Check if repository already exists
-        existing = [r for r in self.index['repositories'] if r['name'] == repo_name]
-        
         repo_entry = {
             'name': repo_name,
             'url': spec['metadata']['repository']['url'],
@@ -65,37 +139,94 @@ class ArtifactIndexer:
             'indicators_count': spec['code_analysis']['summary']['total_indicators'],
             'spec_path': spec_path,
             'doc_path': doc_path,
-            'added_at': datetime.now(timezone.utc).isoformat(),
+            'added_at': datetime.now(_UTC).isoformat(),
         }
         
-        if existing:
-            # Update existing entry
-            idx = self.index['repositories'].index(existing[0])
-            self.index['repositories'][idx] = repo_entry
-        else:
-            # Add new entry
-            self.index['repositories'].append(repo_entry)
+        self._upsert(self.index, repo_entry)
+        self.index['updated_at'] = repo_entry['added_at']
         
-        # Update stats
-        self._update_stats()
+        # Append to the delta log: O(1) bytes per add instead of a full rewrite
+        if self._log is None:
+            self._log = open(self.log_file, 'a', buffering=1 << 16)
+        self._log.write(json.dumps({'op': 'upsert', 'entry': repo_entry}) + '\n')
+        self._log.flush()
+        self._log_entries += 1
         
-        # Save index
-        self.save_index()
+        if self._log_entries > self.compact_ratio * len(self._by_name):
+            self.compact()
+    
+    def _upsert(self, index: Dict[str, Any], repo_entry: Dict[str, Any]):
+        """Insert or replace a repository entry, updating running stats.
+        
+        Args:
+            index: Index dictionary to update in place
+            repo_entry: Repository index entry
+        """
+        name = repo_entry['name']
+        stats = index['stats']
+        prev = self._by_name.get(name)
+        
+        if prev is not None:
+            # Replace existing entry, backing out its contribution
+            stats['total_strategies'] -= prev['strategies_count']
+            stats['total_indicators'] -= prev['indicators_count']
+            stats['total_security_issues'] -= prev['security_issues']
+            index['repositories'][self._slots[name]] = repo_entry
+        else:
+            stats['total_repositories'] += 1
+            self._slots[name] = len(index['repositories'])
+            index['repositories'].append(repo_entry)
+        
+        self._by_name[name] = repo_entry
+        self._sorted_repos = None
+        stats['total_strategies'] += repo_entry['strategies_count']
+        stats['total_indicators'] += repo_entry['indicators_count']
+        stats['total_security_issues'] += repo_entry['security_issues']
     
-    def _update_stats(self):
-        """Update index statistics."""
-        self.index['stats'] = {
-            'total_repositories': len(self.index['repositories']),
-            'total_strategies': sum(r['strategies_count'] for r in self.index['repositories']),
-            'total_indicators': sum(r['indicators_count'] for r in self.index['repositories']),
-            'total_security_issues': sum(r['security_issues'] for r in self.index['repositories']),
+    def _compute_stats(self, repos: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Compute index statistics from scratch.
+        
+        Args:
+            repos: Repository entries
+            
+        Returns:
+            Statistics dictionary
+        """
+        repos = list(repos)
+        return {
+            'total_repositories': len(repos),
+            'total_strategies': sum(r['strategies_count'] for r in repos),
+            'total_indicators': sum(r['indicators_count'] for r in repos),
+            'total_security_issues': sum(r['security_issues'] for r in repos),
         }
-        self.index['updated_at'] = datetime.now(timezone.utc).isoformat()
     
     def save_index(self):
-        """Save index to file."""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        """Save the full index to file atomically."""
+        if orjson is not None:
+            payload = orjson.dumps(self.index, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.index, indent=2).encode('utf-8')
+        tmp = self.index_file + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.index_file)
+    
+    def compact(self):
+        """Fold the delta log into the index file and truncate the log."""
+        self.save_index()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self._log_entries = 0
+    
+    def close(self):
+        """Compact pending log entries and release the log file."""
+        if self._log is not None or self._log_entries:
+            self.compact()
     
     def get_repositories(self, min_score: float = None, 
                         max_security_issues: int = None) -> List[Dict[str, Any]]:
@@ -108,7 +239,7 @@ class ArtifactIndexer:
         Returns:
             List of repository entries
         """
-        repos = self.index['repositories']
+        repos = list(self._by_name.values())
         
         if min_score is not None:
             repos = [r for r in repos if r['trustworthiness_score'] >= min_score]
@@ -118,6 +249,25 @@ class ArtifactIndexer:
         
         return repos
     
+    def get_repository_spec(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Load the saved spec of an indexed repository.
+        
+        Repeated lookups are served from an in-memory cache until the spec
+        file changes on disk.
+        
+        Args:
+            repo_name: Repository full name
+            
+        Returns:
+            Specification dictionary (shared; do not modify), or None if the
+            repository is not indexed
+        """
+        entry = self._by_name.get(repo_name)
+        if entry is None:
+            return None
+        st = os.stat(entry['spec_path'])
+        return _read_spec(entry['spec_path'], st.st_mtime_ns, st.st_size)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get index statistics.
         
@@ -135,7 +285,7 @@ class ArtifactIndexer:
         md = []
         
         md.append("# Moltbot Repository Scout - Index Report\n")
-        md.append(f"Generated: {datetime.now(timezone.utc).isoformat()}\n")
+        md.append(f"Generated: {datetime.now(_UTC).isoformat()}\n")
         
         # Stats
         md.append("## Statistics\n")
@@ -148,20 +298,22 @@ class ArtifactIndexer:
         # Repositories
         md.append("## Repositories\n")
         
-        # Sort by trustworthiness score
-        repos = sorted(self.index['repositories'], 
-                      key=lambda x: x['trustworthiness_score'], 
-                      reverse=True)
-        
-        for repo in repos:
-            md.append(f"### {repo['name']}")
-            md.append(f"- **URL**: {repo['url']}")
-            md.append(f"- **Trust Score**: {repo['trustworthiness_score']} ({repo['trustworthiness_level']})")
-            md.append(f"- **Security Issues**: {repo['security_issues']}")
-            md.append(f"- **Strategies**: {repo['strategies_count']}")
-            md.append(f"- **Indicators**: {repo['indicators_count']}")
-            md.append(f"- **Spec**: `{repo['spec_path']}`")
-            md.append(f"- **Docs**: `{repo['doc_path']}`")
-            md.append(f"- **Added**: {repo['added_at']}\n")
+        # Sorted view is cached until the next add
+        if self._sorted_repos is None:
+            self._sorted_repos = sorted(self._by_name.values(),
+                                        key=lambda x: -x['trustworthiness_score'])
+        
+        for repo in self._sorted_repos:
+            md.append(
+                f"### {repo['name']}\n"
+                f"- **URL**: {repo['url']}\n"
+                f"- **Trust Score**: {repo['trustworthiness_score']} ({repo['trustworthiness_level']})\n"
+                f"- **Security Issues**: {repo['security_issues']}\n"
+                f"- **Strategies**: {repo['strategies_count']}\n"
+                f"- **Indicators**: {repo['indicators_count']}\n"
+                f"- **Spec**: `{repo['spec_path']}`\n"
+                f"- **Docs**: `{repo['doc_path']}`\n"
+                f"- **Added**: {repo['added_at']}\n"
+            )
         
         return '\n'.join(md)
@@ -1,9 +1,71 @@
 """Normalizer module for converting parsed data to JSON specs."""
+import gzip
 import json
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_UTC = timezone.utc
+
+# Fixed part of the per-repository markdown doc; the strategy and indicator
+# listings are appended after it
+_DOC_TEMPLATE = """\
+# {name}
+
+{description}## Repository Information
+
+- **URL**: {url}
+- **Language**: {language}
+- **License**: {license}
+- **Created**: {created_at}
+- **Last Updated**: {updated_at}
+
+## Trustworthiness Analysis
+
+- **Overall Score**: {overall_score} ({level})
+- **Stars**: {stars}
+- **Forks**: {forks}
+- **Open Issues**: {open_issues}
+
+## Security Scan Results
+
+- **Files Scanned**: {files_scanned}
+- **Total Issues**: {total_issues}
+- **Secrets Found**: {secrets_found}
+- **Suspicious Code Patterns**: {suspicious_code_found}
+
+## Code Analysis
+
+- **Files Parsed**: {files_parsed}
+- **Strategies Found**: {total_strategies}
+- **Indicators Found**: {total_indicators}
+- **Risk Management Functions**: {total_risk_functions}
+"""
+_LOCATION_KEYS = ('name', 'file', 'line')
+_STRATEGY_KEYS = ('name', 'type', 'file', 'line')
+
+
+def _proj(item: NamedTuple, keys, **extra) -> Dict[str, Any]:
+    """Project a parsed element onto ``keys`` plus a one-line description.
+    
+    Args:
+        item: Parsed element record (StrategyRec or FuncRec)
+        keys: Keys to copy from the element
+        **extra: Additional fields appended after the description
+        
+    Returns:
+        Normalized element dictionary
+    """
+    out = {k: getattr(item, k) for k in keys}
+    out['description'] = (item.docstring or '').partition('\n')[0]
+    out.update(extra)
+    return out
+
 
 class SpecNormalizer:
     """Normalizes parsed data into standardized JSON specifications."""
@@ -21,10 +83,16 @@ class SpecNormalizer:
         Returns:
             Normalized specification dictionary
         """
+        strategies = parsed_info.get('strategies', [])
+        indicators = parsed_info.get('indicators', [])
+        risk_logic = parsed_info.get('risk_logic', [])
+        secrets = security_info.get('secrets_found', [])
+        suspicious = security_info.get('suspicious_code', [])
+        
         spec = {
             'metadata': {
                 'spec_version': '1.0',
-                'generated_at': datetime.now(timezone.utc).isoformat(),
+                'generated_at': datetime.now(_UTC).isoformat(),
                 'repository': {
                     'name': repo_info.get('full_name'),
                     'url': repo_info.get('url'),
@@ -49,23 +117,27 @@ class SpecNormalizer:
                 'scanned': True,
                 'files_scanned': security_info.get('files_scanned', 0),
                 'total_issues': security_info.get('total_issues', 0),
-                'secrets_found': len(security_info.get('secrets_found', [])),
-                'suspicious_code_found': len(security_info.get('suspicious_code', [])),
+                'secrets_found': len(secrets),
+                'suspicious_code_found': len(suspicious),
                 'issues': {
-                    'secrets': security_info.get('secrets_found', []),
-                    'suspicious': security_info.get('suspicious_code', []),
-                }
+                    'secrets': secrets,
+                    'suspicious': suspicious,
+                },
+                # Files whose issues were cut at the per-file limit
+                'truncated_files': security_info.get('truncated_files', []),
+                # Regex of each issue's pattern_id, per category
+                'patterns': security_info.get('pattern_catalog', {}),
             },
             'code_analysis': {
                 'files_parsed': parsed_info.get('files_parsed', 0),
                 'parse_errors': len(parsed_info.get('parse_errors', [])),
-                'strategies': self._normalize_strategies(parsed_info.get('strategies', [])),
-                'indicators': self._normalize_indicators(parsed_info.get('indicators', [])),
-                'risk_management': self._normalize_risk_logic(parsed_info.get('risk_logic', [])),
+                'strategies': self._normalize_strategies(strategies),
+                'indicators': self._normalize_indicators(indicators),
+                'risk_management': self._normalize_risk_logic(risk_logic),
                 'summary': {
-                    'total_strategies': len(parsed_info.get('strategies', [])),
-                    'total_indicators': len(parsed_info.get('indicators', [])),
-                    'total_risk_functions': len(parsed_info.get('risk_logic', [])),
+                    'total_strategies': len(strategies),
+                    'total_indicators': len(indicators),
+                    'total_risk_functions': len(risk_logic),
                     'total_classes': len(parsed_info.get('classes', [])),
                     'total_functions': len(parsed_info.get('functions', [])),
                 }
@@ -74,78 +146,74 @@ class SpecNormalizer:
         
         return spec
     
-    def _normalize_strategies(self, strategies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _normalize_strategies(self, strategies: List[NamedTuple]) -> List[Dict[str, Any]]:
         """Normalize strategy information.
         
         Args:
-            strategies: List of strategy dictionaries
+            strategies: List of StrategyRec records
             
         Returns:
             Normalized strategy list
         """
         return [
-            {
-                'name': s.get('name'),
-                'type': s.get('type'),
-                'file': s.get('file'),
-                'line': s.get('line'),
-                'description': s.get('docstring', '').split('\n')[0] if s.get('docstring') else '',
-                'parameters': s.get('args', []) if s.get('type') == 'function' else [],
-                'methods': s.get('methods', []) if s.get('type') == 'class' else [],
-            }
+            _proj(s, _STRATEGY_KEYS,
+                  parameters=list(s.args) if s.type == 'function' else [],
+                  methods=list(s.methods) if s.type == 'class' else [])
             for s in strategies
         ]
     
-    def _normalize_indicators(self, indicators: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _normalize_indicators(self, indicators: List[NamedTuple]) -> List[Dict[str, Any]]:
         """Normalize indicator information.
         
         Args:
-            indicators: List of indicator dictionaries
+            indicators: List of FuncRec records
             
         Returns:
             Normalized indicator list
         """
-        return [
-            {
-                'name': i.get('name'),
-                'file': i.get('file'),
-                'line': i.get('line'),
-                'description': i.get('docstring', '').split('\n')[0] if i.get('docstring') else '',
-                'parameters': i.get('args', []),
-            }
-            for i in indicators
-        ]
+        return [_proj(i, _LOCATION_KEYS, parameters=list(i.args)) for i in indicators]
     
-    def _normalize_risk_logic(self, risk_logic: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _normalize_risk_logic(self, risk_logic: List[NamedTuple]) -> List[Dict[str, Any]]:
         """Normalize risk management logic.
         
         Args:
-            risk_logic: List of risk logic dictionaries
+            risk_logic: List of FuncRec records
             
         Returns:
             Normalized risk logic list
         """
-        return [
-            {
-                'name': r.get('name'),
-                'file': r.get('file'),
-                'line': r.get('line'),
-                'description': r.get('docstring', '').split('\n')[0] if r.get('docstring') else '',
-                'parameters': r.get('args', []),
-            }
-            for r in risk_logic
-        ]
+        return [_proj(r, _LOCATION_KEYS, parameters=list(r.args)) for r in risk_logic]
     
-    def save_spec(self, spec: Dict[str, Any], output_path: str):
+    def save_spec(self, spec: Dict[str, Any], output_path: str,
+                  compact: bool = True, compress: bool = False) -> str:
         """Save specification to JSON file.
         
         Args:
             spec: Specification dictionary
             output_path: Path to save JSON file
+            compact: Write without indentation (specs are mostly read by
+                tools; pass False for human-friendly output)
+            compress: Gzip the output and append '.gz' to output_path
+            
+        Returns:
+            Path of the file actually written
         """
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(spec, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            data = orjson.dumps(spec, option=0 if compact else orjson.OPT_INDENT_2)
+        elif compact:
+            data = json.dumps(spec, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        else:
+            data = json.dumps(spec, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        if compress:
+            output_path += '.gz'
+            with gzip.open(output_path, 'wb', compresslevel=3) as f:
+                f.write(data)
+        else:
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        return output_path
     
     def generate_markdown_doc(self, spec: Dict[str, Any]) -> str:
         """Generate markdown documentation from specification.
@@ -156,68 +224,58 @@ class SpecNormalizer:
         Returns:
             Markdown documentation string
         """
-        md = []
-        
-        # Header
-        repo_name = spec['metadata']['repository']['name']
-        md.append(f"# {repo_name}\n")
-        
-        # Description
-        desc = spec['metadata']['repository']['description']
-        if desc:
-            md.append(f"{desc}\n")
-        
-        # Metadata
-        md.append("## Repository Information\n")
-        md.append(f"- **URL**: {spec['metadata']['repository']['url']}")
-        md.append(f"- **Language**: {spec['metadata']['repository']['language']}")
-        md.append(f"- **License**: {spec['metadata']['repository']['license']}")
-        md.append(f"- **Created**: {spec['metadata']['repository']['created_at']}")
-        md.append(f"- **Last Updated**: {spec['metadata']['repository']['updated_at']}\n")
-        
-        # Trustworthiness
-        md.append("## Trustworthiness Analysis\n")
+        repo = spec['metadata']['repository']
         trust = spec['trustworthiness']
-        md.append(f"- **Overall Score**: {trust['overall_score']} ({trust['level']})")
-        md.append(f"- **Stars**: {trust['metrics']['stars']}")
-        md.append(f"- **Forks**: {trust['metrics']['forks']}")
-        md.append(f"- **Open Issues**: {trust['metrics']['open_issues']}\n")
-        
-        # Security
-        md.append("## Security Scan Results\n")
         sec = spec['security']
-        md.append(f"- **Files Scanned**: {sec['files_scanned']}")
-        md.append(f"- **Total Issues**: {sec['total_issues']}")
-        md.append(f"- **Secrets Found**: {sec['secrets_found']}")
-        md.append(f"- **Suspicious Code Patterns**: {sec['suspicious_code_found']}\n")
-        
-        # Code Analysis
-        md.append("## Code Analysis\n")
         analysis = spec['code_analysis']
-        md.append(f"- **Files Parsed**: {analysis['files_parsed']}")
-        md.append(f"- **Strategies Found**: {analysis['summary']['total_strategies']}")
-        md.append(f"- **Indicators Found**: {analysis['summary']['total_indicators']}")
-        md.append(f"- **Risk Management Functions**: {analysis['summary']['total_risk_functions']}\n")
+        summary = analysis['summary']
+        
+        doc = _DOC_TEMPLATE.format_map({
+            'name': repo['name'],
+            'description': f"{repo['description']}\n\n" if repo['description'] else '',
+            'url': repo['url'],
+            'language': repo['language'],
+            'license': repo['license'],
+            'created_at': repo['created_at'],
+            'updated_at': repo['updated_at'],
+            'overall_score': trust['overall_score'],
+            'level': trust['level'],
+            'stars': trust['metrics']['stars'],
+            'forks': trust['metrics']['forks'],
+            'open_issues': trust['metrics']['open_issues'],
+            'files_scanned': sec['files_scanned'],
+            'total_issues': sec['total_issues'],
+            'secrets_found': sec['secrets_found'],
+            'suspicious_code_found': sec['suspicious_code_found'],
+            'files_parsed': analysis['files_parsed'],
+            'total_strategies': summary['total_strategies'],
+            'total_indicators': summary['total_indicators'],
+            'total_risk_functions': summary['total_risk_functions'],
+        })
+        
+        sections = [doc]
         
         # Strategies
         if analysis['strategies']:
-            md.append("### Strategies\n")
-            for strategy in analysis['strategies']:
-                md.append(f"- **{strategy['name']}** ({strategy['type']})")
-                if strategy['description']:
-                    md.append(f"  - {strategy['description']}")
-                md.append(f"  - Location: `{strategy['file']}:{strategy['line']}`\n")
+            sections.append("\n### Strategies\n")
+            sections.extend(
+                f"\n- **{s['name']}** ({s['type']})"
+                + (f"\n  - {s['description']}" if s['description'] else '')
+                + f"\n  - Location: `{s['file']}:{s['line']}`\n"
+                for s in analysis['strategies']
+            )
         
         # Indicators
         if analysis['indicators']:
-            md.append("### Indicators\n")
-            for indicator in analysis['indicators']:
-                md.append(f"- **{indicator['name']}**")
-                if indicator['description']:
-                    md.append(f"  - {indicator['description']}")
-                md.append(f"  - Location: `{indicator['file']}:{indicator['line']}`\n")
-        
-        return '\n'.join(md)
+            sections.append("\n### Indicators\n")
+            sections.extend(
+                f"\n- **{i['name']}**"
+                + (f"\n  - {i['description']}" if i['description'] else '')
+                + f"\n  - Location: `{i['file']}:{i['line']}`\n"
+                for i in analysis['indicators']
+            )
+        
+        return ''.join(sections)
     
     def save_markdown_doc(self, spec: Dict[str, Any], output_path: str):
         """Save markdown documentation.
@@ -1,28 +1,135 @@
 """AST-based code parser module for strategy extraction."""
 import ast
+import codecs
+import hashlib
 import os
-from typing import Dict, Any, List, Set
+import pickle
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import fcntl  # POSIX file locks for concurrent cache saves
+except ImportError:
+    fcntl = None
+
+
+# Statement fields that can hold nested definitions, by node type. Expression
+# subtrees are never entered.
+_BODY_FIELDS = {
+    ast.If: ('body', 'orelse'),
+    ast.For: ('body', 'orelse'),
+    ast.AsyncFor: ('body', 'orelse'),
+    ast.While: ('body', 'orelse'),
+    ast.With: ('body',),
+    ast.AsyncWith: ('body',),
+    ast.Try: ('body', 'handlers', 'orelse', 'finalbody'),
+    ast.ExceptHandler: ('body',),
+}
+if hasattr(ast, 'Match'):  # Python 3.10+
+    _BODY_FIELDS[ast.Match] = ('cases',)
+    _BODY_FIELDS[ast.match_case] = ('body',)
+if hasattr(ast, 'TryStar'):  # Python 3.11+
+    _BODY_FIELDS[ast.TryStar] = _BODY_FIELDS[ast.Try]
+
+
+class MethodRec(NamedTuple):
+    """Method of a parsed class."""
+    name: str
+    args: Tuple[str, ...]
+    line: int
+
+
+class ClassRec(NamedTuple):
+    """Parsed class definition."""
+    name: str
+    file: str
+    line: int
+    bases: Tuple[Optional[str], ...]
+    methods: Tuple[MethodRec, ...]
+    docstring: Optional[str]
+
+
+class FuncRec(NamedTuple):
+    """Parsed function definition (also used for indicators and risk logic)."""
+    name: str
+    file: str
+    line: int
+    args: Tuple[str, ...]
+    returns: Optional[str]
+    docstring: Optional[str]
+
+
+class StrategyRec(NamedTuple):
+    """Strategy class or function; args is empty for classes, methods for functions."""
+    type: str
+    name: str
+    file: str
+    line: int
+    docstring: Optional[str]
+    args: Tuple[str, ...]
+    methods: Tuple[str, ...]
+
+
+# Directories that hold vendored, generated or tool state rather than source
+_SKIP_DIRS = frozenset({
+    '.git', '__pycache__', 'venv', 'env', '.venv', '.tox', 'node_modules',
+    'build', 'dist', 'site-packages', '.mypy_cache', '.pytest_cache', '.eggs',
+    '.idea', '.vscode',
+})
+
+# Below this many files the process-pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 64
+_PARSE_CHUNKSIZE = 32
+
+# Bump when the shape of per-file parse results changes
+_PARSE_CACHE_VERSION = 3
 
 
 class StrategyParser:
     """Parses Python code using AST to extract trading strategies without imports."""
     
-    def __init__(self, max_file_size: int = 1048576):
+    def __init__(self, max_file_size: int = 1048576, max_workers: Optional[int] = None,
+                 cache_path: Optional[str] = None, cache_size: int = 50000,
+                 parse_tests: bool = True):
         """Initialize strategy parser.
         
         Args:
             max_file_size: Maximum file size to parse (default: 1MB)
+            max_workers: Processes used to parse large repositories (default:
+                CPU count); 1 always parses in the calling process
+            cache_path: Pickle file for persisting per-file parse results
+                between runs (None disables the cache)
+            cache_size: Maximum number of cached files (least recently used
+                entries are evicted first)
+            parse_tests: Whether to parse test modules (test_*.py, *_test.py,
+                conftest.py)
         """
         self.max_file_size = max_file_size
+        self.max_workers = max_workers
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self.cache_size = cache_size
+        self.parse_tests = parse_tests
+        self._cache = self._load_cache() if self.cache_path else None
+        # Entries hit or added since the last save, merged into the file then
+        self._recent: Dict[Tuple[str, bytes], Dict[str, List[NamedTuple]]] = {}
     
     def parse_repository(self, repo_path: str) -> Dict[str, Any]:
         """Parse all Python files in repository.
         
+        Repositories with more than _PARALLEL_MIN_FILES files to parse are
+        parsed across a process pool. With a cache, sources are read here and
+        only cache misses are sent to the pool.
+        
         Args:
             repo_path: Path to cloned repository
             
         Returns:
-            Dictionary with extracted information
+            Dictionary with extracted information; element lists hold
+            StrategyRec, FuncRec and ClassRec records
         """
         results = {
             'strategies': [],
@@ -34,205 +141,446 @@ class StrategyParser:
             'parse_errors': [],
         }
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip .git and common non-source directories
-            dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'venv', 'env', 'node_modules'}]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, repo_path)
-                    
-                    # Skip files that are too large
-                    if os.path.getsize(file_path) > self.max_file_size:
-                        continue
-                    
-                    file_results = self._parse_file(file_path, rel_path)
-                    if file_results:
-                        results['strategies'].extend(file_results.get('strategies', []))
-                        results['indicators'].extend(file_results.get('indicators', []))
-                        results['risk_logic'].extend(file_results.get('risk_logic', []))
-                        results['classes'].extend(file_results.get('classes', []))
-                        results['functions'].extend(file_results.get('functions', []))
-                        results['files_parsed'] += 1
-                    else:
-                        results['parse_errors'].append(rel_path)
+        prefix_len = len(os.path.join(repo_path, ''))
+        file_paths = list(_iter_py(repo_path, self.max_file_size, self.parse_tests))
+        rel_paths = [path[prefix_len:] for path in file_paths]
+        
+        if self._cache is not None:
+            parsed = self._parse_cached(file_paths, rel_paths)
+        else:
+            parsed = self._map(_parse_file, file_paths, rel_paths)
         
+        self._collect(results, rel_paths, parsed)
         return results
     
-    def _parse_file(self, file_path: str, rel_path: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Parse a single Python file using AST.
+    def _map(self, func: Callable, *iterables: List) -> List:
+        """Apply a module-level function across files, in a pool when worthwhile.
         
         Args:
-            file_path: Absolute path to file
-            rel_path: Relative path for reporting
+            func: Picklable function to apply
+            *iterables: Equal-length argument lists
             
         Returns:
-            Dictionary with extracted elements
+            List of results in input order
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=rel_path)
-            
-            visitor = StrategyVisitor(rel_path)
-            visitor.visit(tree)
-            
-            return {
-                'strategies': visitor.strategies,
-                'indicators': visitor.indicators,
-                'risk_logic': visitor.risk_logic,
-                'classes': visitor.classes,
-                'functions': visitor.functions,
-            }
+        if self.max_workers != 1 and len(iterables[0]) > _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(func, *iterables, chunksize=_PARSE_CHUNKSIZE))
+        return list(map(func, *iterables))
+    
+    def _parse_cached(self, file_paths: List[str], rel_paths: List[str]) -> List:
+        """Parse files, reusing cached results for unchanged sources.
+        
+        Entries are keyed by relative path and a digest of the file content,
+        so a fresh clone of an unchanged repository still hits the cache even
+        though every file has a new mtime.
+        
+        Args:
+            file_paths: Absolute file paths
+            rel_paths: Relative paths, in the same order
             
-        except SyntaxError as e:
-            print(f"Syntax error in {rel_path}: {e}")
-            return None
+        Returns:
+            Per-file results in input order (None on error)
+        """
+        cache = self._cache
+        parsed = [None] * len(file_paths)
+        keys = [None] * len(file_paths)
+        misses = []
+        sources = []
+        
+        for i, (file_path, rel_path) in enumerate(zip(file_paths, rel_paths)):
+            content = _read_source(file_path, rel_path)
+            if content is None:
+                continue
+            key = (rel_path, hashlib.blake2b(content, digest_size=16).digest())
+            hit = cache.get(key)
+            if hit is not None:
+                cache.move_to_end(key)
+                self._recent[key] = hit
+                parsed[i] = hit
+            else:
+                keys[i] = key
+                misses.append(i)
+                sources.append(content)
+        
+        if misses:
+            miss_paths = [rel_paths[i] for i in misses]
+            for i, file_results in zip(misses, self._map(_parse_source, sources, miss_paths)):
+                parsed[i] = file_results
+                if file_results is not None:
+                    cache[keys[i]] = file_results
+                    self._recent[keys[i]] = file_results
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+            self._save_cache()
+        
+        return parsed
+    
+    def _load_cache(self) -> OrderedDict:
+        """Load the persisted parse cache, starting empty if unusable.
+        
+        Returns:
+            Ordered mapping of (rel_path, digest) to per-file results, least
+            recently used first
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == _PARSE_CACHE_VERSION:
+                return data['entries']
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Error parsing {rel_path}: {e}")
-            return None
+            print(f"Ignoring unreadable parse cache {self.cache_path}: {e}")
+        return OrderedDict()
+    
+    def _save_cache(self):
+        """Merge recent entries into the persisted parse cache and replace it atomically.
+        
+        Other processes sharing the cache file (e.g. discover's analysis
+        workers) may have saved since this cache was loaded, so the file is
+        re-read and this process's recent entries are merged in as most
+        recently used, rather than overwriting theirs. Saves are serialized
+        with a lock file where fcntl is available. A failed save is reported
+        and leaves the file as it was; the recent entries are kept for the
+        next attempt.
+        """
+        tmp = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with _locked(f'{self.cache_path}.lock'):
+                merged = self._load_cache()
+                for key, file_results in self._recent.items():
+                    merged[key] = file_results
+                    merged.move_to_end(key)
+                while len(merged) > self.cache_size:
+                    merged.popitem(last=False)
+                
+                with open(tmp, 'wb') as f:
+                    pickle.dump({'version': _PARSE_CACHE_VERSION, 'entries': merged}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self.cache_path)
+        except Exception as e:
+            print(f"Could not save parse cache {self.cache_path}: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        
+        self._cache = merged
+        self._recent = {}
+    
+    def _collect(self, results: Dict[str, Any], rel_paths: List[str],
+                 parsed: Iterable[Optional[Dict[str, List[NamedTuple]]]]):
+        """Merge per-file parse results into the repository results.
+        
+        Args:
+            results: Repository results to extend in place
+            rel_paths: Relative paths, in the same order as parsed
+            parsed: Per-file results from _parse_file (None on error)
+        """
+        for rel_path, file_results in zip(rel_paths, parsed):
+            if file_results:
+                results['strategies'].extend(file_results.get('strategies', []))
+                results['indicators'].extend(file_results.get('indicators', []))
+                results['risk_logic'].extend(file_results.get('risk_logic', []))
+                results['classes'].extend(file_results.get('classes', []))
+                results['functions'].extend(file_results.get('functions', []))
+                results['files_parsed'] += 1
+            else:
+                results['parse_errors'].append(rel_path)
+
+
+@contextmanager
+def _locked(lock_path: str):
+    """Hold an exclusive lock on a lock file for the enclosed block.
+    
+    A no-op where fcntl is unavailable (Windows); saves there can still
+    race, but each one replaces the file atomically.
+    
+    Args:
+        lock_path: Path of the lock file (created if missing)
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(lock_path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _is_test_module(name: str) -> bool:
+    """Check whether a file name looks like a pytest/unittest module.
+    
+    Args:
+        name: File name
+        
+    Returns:
+        True for test_*.py, *_test.py and conftest.py
+    """
+    return name.startswith('test_') or name.endswith('_test.py') or name == 'conftest.py'
+
+
+def _iter_py(path: str, max_file_size: int, parse_tests: bool = True) -> Iterator[str]:
+    """Yield Python files under path, in os.walk top-down order.
+    
+    Uses os.scandir so the directory read supplies file types and the size
+    check needs one stat per candidate file.
+    
+    Args:
+        path: Directory to walk
+        max_file_size: Files larger than this (bytes) are skipped
+        parse_tests: Whether to include test modules
+        
+    Yields:
+        Paths of Python files, each prefixed with path
+    """
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                if not parse_tests and _is_test_module(entry.name):
+                    continue
+                if entry.stat().st_size <= max_file_size:
+                    yield entry.path
+    
+    for subdir in subdirs:
+        yield from _iter_py(subdir, max_file_size, parse_tests)
+
+
+def _read_source(file_path: str, rel_path: str) -> Optional[bytes]:
+    """Read a source file's bytes.
+    
+    Args:
+        file_path: Absolute path to file
+        rel_path: Relative path for reporting
+        
+    Returns:
+        File contents, or None if the file could not be read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except Exception as e:
+        print(f"Error parsing {rel_path}: {e}")
+        return None
+
+
+def _parse_file(file_path: str, rel_path: str) -> Dict[str, List[NamedTuple]]:
+    """Parse a single Python file using AST.
+    
+    Module-level so it can be dispatched to a process pool.
+    
+    Args:
+        file_path: Absolute path to file
+        rel_path: Relative path for reporting
+        
+    Returns:
+        Dictionary with extracted elements
+    """
+    content = _read_source(file_path, rel_path)
+    if content is None:
+        return None
+    return _parse_source(content, rel_path)
+
+
+def _parse_source(content: bytes, rel_path: str) -> Dict[str, List[NamedTuple]]:
+    """Parse Python source bytes using AST.
+    
+    Args:
+        content: Raw file contents
+        rel_path: Relative path for reporting
+        
+    Returns:
+        Dictionary with extracted elements
+    """
+    try:
+        # ast.parse decodes bytes itself (honouring PEP 263 coding cookies)
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        tree = ast.parse(content, filename=rel_path)
+        
+        visitor = StrategyVisitor(rel_path)
+        visitor.visit(tree)
+        
+        return {
+            'strategies': visitor.strategies,
+            'indicators': visitor.indicators,
+            'risk_logic': visitor.risk_logic,
+            'classes': visitor.classes,
+            'functions': visitor.functions,
+        }
+        
+    except SyntaxError as e:
+        print(f"Syntax error in {rel_path}: {e}")
+        return None
+    except Exception as e:
+        print(f"Error parsing {rel_path}: {e}")
+        return None
 
 
 class StrategyVisitor(ast.NodeVisitor):
     """AST visitor for extracting trading strategy elements."""
     
+    # Keywords for identification, matched as substrings of the lowercased name
+    strategy_keywords = frozenset({'strategy', 'trade', 'signal', 'backtest', 'order', 'position'})
+    indicator_keywords = frozenset({'indicator', 'sma', 'ema', 'rsi', 'macd', 'bollinger', 'moving_average'})
+    risk_keywords = frozenset({'risk', 'stop_loss', 'take_profit', 'position_size', 'drawdown'})
+    
+    # One alternation per keyword set so each check is a single C-level scan
+    _strategy_re = re.compile('|'.join(map(re.escape, sorted(strategy_keywords))))
+    _indicator_re = re.compile('|'.join(map(re.escape, sorted(indicator_keywords))))
+    _risk_re = re.compile('|'.join(map(re.escape, sorted(risk_keywords))))
+    
     def __init__(self, file_path: str):
         """Initialize visitor.
         
         Args:
             file_path: Path to file being parsed
         """
-        self.file_path = file_path
+        # Every record of the file shares one interned path string
+        self.file_path = sys.intern(file_path)
         self.strategies = []
         self.indicators = []
         self.risk_logic = []
         self.classes = []
         self.functions = []
+    
+    def visit_Module(self, node: ast.Module):
+        """Visit a module's top-level statements.
         
-        # Keywords for identification
-        self.strategy_keywords = {'strategy', 'trade', 'signal', 'backtest', 'order', 'position'}
-        self.indicator_keywords = {'indicator', 'sma', 'ema', 'rsi', 'macd', 'bollinger', 'moving_average'}
-        self.risk_keywords = {'risk', 'stop_loss', 'take_profit', 'position_size', 'drawdown'}
+        Args:
+            node: AST Module node
+        """
+        self._walk_defs(node.body)
     
     def visit_ClassDef(self, node: ast.ClassDef):
-        """Visit class definitions.
+        """Visit class definitions and the definitions nested in them.
         
         Args:
             node: AST ClassDef node
         """
-        class_info = {
-            'name': node.name,
-            'file': self.file_path,
-            'line': node.lineno,
-            'bases': [self._get_name(base) for base in node.bases],
-            'methods': [],
-            'docstring': ast.get_docstring(node),
-        }
+        self._walk_defs([node])
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        """Visit function definitions and the definitions nested in them.
+        
+        Args:
+            node: AST FunctionDef node
+        """
+        self._walk_defs([node])
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def _walk_defs(self, body: List[ast.stmt]):
+        """Record every class and function definition reachable from body.
+        
+        Walks statement bodies iteratively in source order (the order
+        generic_visit would reach them) without descending into expressions.
         
-        # Extract methods
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                class_info['methods'].append({
-                    'name': item.name,
-                    'args': [arg.arg for arg in item.args.args],
-                    'line': item.lineno,
-                })
+        Args:
+            body: List of statement nodes
+        """
+        stack = list(reversed(body))
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.ClassDef:
+                self._add_class(node)
+                stack.extend(reversed(node.body))
+            elif node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                self._add_function(node)
+                stack.extend(reversed(node.body))
+            else:
+                fields = _BODY_FIELDS.get(node_type)
+                if fields:
+                    for field in reversed(fields):
+                        stack.extend(reversed(getattr(node, field)))
+    
+    def _add_class(self, node: ast.ClassDef):
+        """Record a class definition.
+        
+        Args:
+            node: AST ClassDef node
+        """
+        name = node.name
+        docstring = ast.get_docstring(node)
+        methods = tuple(
+            MethodRec(item.name, tuple(sys.intern(arg.arg) for arg in item.args.args), item.lineno)
+            for item in node.body
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+        )
         
-        self.classes.append(class_info)
+        self.classes.append(ClassRec(
+            name, self.file_path, node.lineno,
+            tuple(self._get_name(base) for base in node.bases),
+            methods, docstring,
+        ))
         
         # Check if it's a strategy class
-        if self._contains_keywords(node.name.lower(), self.strategy_keywords):
-            self.strategies.append({
-                'type': 'class',
-                'name': node.name,
-                'file': self.file_path,
-                'line': node.lineno,
-                'docstring': class_info['docstring'],
-                'methods': [m['name'] for m in class_info['methods']],
-            })
-        
-        # Continue visiting child nodes
-        self.generic_visit(node)
+        if self._strategy_re.search(name.lower()):
+            self.strategies.append(StrategyRec(
+                'class', name, self.file_path, node.lineno, docstring,
+                (), tuple(m.name for m in methods),
+            ))
     
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        """Visit function definitions.
+    def _add_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]):
+        """Record a function definition (sync or async).
+        
+        The same FuncRec is shared by the functions, indicators and risk
+        lists.
         
         Args:
-            node: AST FunctionDef node
+            node: AST FunctionDef or AsyncFunctionDef node
         """
-        func_info = {
-            'name': node.name,
-            'file': self.file_path,
-            'line': node.lineno,
-            'args': [arg.arg for arg in node.args.args],
-            'returns': self._get_name(node.returns) if node.returns else None,
-            'docstring': ast.get_docstring(node),
-        }
+        name = node.name
+        lname = name.lower()
+        args = tuple(sys.intern(arg.arg) for arg in node.args.args)
+        docstring = ast.get_docstring(node)
         
-        self.functions.append(func_info)
+        rec = FuncRec(
+            name, self.file_path, node.lineno, args,
+            self._get_name(node.returns) if node.returns else None,
+            docstring,
+        )
+        self.functions.append(rec)
         
         # Check if it's a strategy function
-        if self._contains_keywords(node.name.lower(), self.strategy_keywords):
-            self.strategies.append({
-                'type': 'function',
-                'name': node.name,
-                'file': self.file_path,
-                'line': node.lineno,
-                'docstring': func_info['docstring'],
-                'args': func_info['args'],
-            })
+        if self._strategy_re.search(lname):
+            self.strategies.append(StrategyRec(
+                'function', name, self.file_path, node.lineno, docstring, args, (),
+            ))
         
         # Check if it's an indicator function
-        if self._contains_keywords(node.name.lower(), self.indicator_keywords):
-            self.indicators.append({
-                'name': node.name,
-                'file': self.file_path,
-                'line': node.lineno,
-                'docstring': func_info['docstring'],
-                'args': func_info['args'],
-            })
+        if self._indicator_re.search(lname):
+            self.indicators.append(rec)
         
         # Check if it's risk management logic
-        if self._contains_keywords(node.name.lower(), self.risk_keywords):
-            self.risk_logic.append({
-                'name': node.name,
-                'file': self.file_path,
-                'line': node.lineno,
-                'docstring': func_info['docstring'],
-                'args': func_info['args'],
-            })
-        
-        # Continue visiting child nodes
-        self.generic_visit(node)
+        if self._risk_re.search(lname):
+            self.risk_logic.append(rec)
     
-    def _get_name(self, node) -> str:
-        """Get name from AST node.
+    def _get_name(self, node) -> Optional[str]:
+        """Get dotted name from a Name or Attribute chain.
         
         Args:
             node: AST node
             
         Returns:
-            String representation of name
+            Dotted name (e.g. 'bt.Strategy'), or None for anything that is
+            not a plain name chain (subscripts, calls, constants, ...)
         """
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        elif node is None:
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
             return None
-        else:
-            return str(node)
-    
-    def _contains_keywords(self, text: str, keywords: Set[str]) -> bool:
-        """Check if text contains any of the keywords.
-        
-        Args:
-            text: Text to check
-            keywords: Set of keywords
-            
-        Returns:
-            True if any keyword found
-        """
-        return any(keyword in text for keyword in keywords)
+        if not parts:
+            return sys.intern(node.id)
+        parts.append(node.id)
+        return sys.intern('.'.join(reversed(parts)))
@@ -1,12 +1,59 @@
 """Repository scoring and trustworthiness evaluation module."""
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional
+from bisect import bisect_right
 from datetime import datetime, timezone
+import functools
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from moltbot_scout.scoring._numba_kernels import score_batch as _numba_score_batch
+except ImportError:
+    _numba_score_batch = None
+
 
 class RepoScorer:
     """Scores repository trustworthiness based on multiple factors."""
     
+    # Age in days where each linear segment starts, and per segment
+    # (start, base score, days to gain another 0.25)
+    _AGE_THRESH = (30, 180, 365)
+    _AGE_SEGMENTS = (
+        (0, 0.25, float('inf')),
+        (30, 0.25, 150),
+        (180, 0.5, 185),
+        (365, 0.75, 365),
+    )
+    
+    # Days since last push and the score of each band
+    _ACTIVITY_THRESH = (7, 30, 90, 180, 365)
+    _ACTIVITY_SCORES = (1.0, 0.9, 0.7, 0.5, 0.3, 0.1)
+    
+    # Scores of preferred open source licenses; other licenses score 0.7
+    _LICENSE_SCORES = {
+        'MIT License': 1.0,
+        'Apache License 2.0': 1.0,
+        'GNU General Public License v3.0': 0.9,
+        'BSD 3-Clause "New" or "Revised" License': 1.0,
+        'BSD 2-Clause "Simplified" License': 1.0,
+    }
+    
+    # Lowest overall score of each trustworthiness level above 'low'
+    _LEVEL_CUTOFFS = (0.2, 0.4, 0.6, 0.8)
+    _LEVELS = ('low', 'low-medium', 'medium', 'medium-high', 'high')
+    
+    # Component order of the compiled batch kernel, which sums weighted
+    # components in this order; other weight layouts use the NumPy path
+    _FACTORS = ('stars', 'age', 'commits', 'license', 'activity')
+    
+    # Batches smaller than this are not worth the kernel's first-call
+    # compilation
+    _NUMBA_MIN_BATCH = 1024
+    
     def __init__(self, weights: Dict[str, float] = None):
         """Initialize repository scorer.
         
@@ -21,21 +68,23 @@ class RepoScorer:
             'activity': 0.15
         }
     
-    def score_repository(self, repo_info: Dict[str, Any]) -> Dict[str, Any]:
+    def score_repository(self, repo_info: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Score a repository for trustworthiness.
         
         Args:
             repo_info: Repository information dictionary
+            now: Reference time (default: current UTC time)
             
         Returns:
             Dictionary with overall score and component scores
         """
+        now = now or datetime.now(timezone.utc)
         scores = {
             'stars_score': self._score_stars(repo_info.get('stars', 0)),
-            'age_score': self._score_age(repo_info.get('created_at')),
+            'age_score': self._score_age(repo_info.get('created_at'), now),
             'commits_score': self._score_commits(repo_info),
             'license_score': self._score_license(repo_info.get('license')),
-            'activity_score': self._score_activity(repo_info),
+            'activity_score': self._score_activity(repo_info, now),
         }
         
         # Calculate weighted overall score
@@ -50,6 +99,122 @@ class RepoScorer:
             'trustworthiness': self._get_trustworthiness_level(overall_score)
         }
     
+    def score_repositories(self, repos: Iterable[Dict[str, Any]],
+                           now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Score a batch of repositories for trustworthiness.
+        
+        With NumPy installed the component scores of the whole batch are
+        computed as array operations, or for large batches in a single
+        compiled loop when numba is also installed; otherwise each repository
+        goes through score_repository(). All give the same results up to
+        floating-point rounding.
+        
+        Args:
+            repos: Repository information dictionaries
+            now: Reference time for all repositories (default: current UTC time)
+            
+        Returns:
+            List of score dictionaries, in the order of repos
+        """
+        now = now or datetime.now(timezone.utc)
+        repos = list(repos)
+        if np is None or not repos:
+            return [self.score_repository(repo, now) for repo in repos]
+        
+        count = len(repos)
+        nan = float('nan')
+        stars = np.fromiter((r.get('stars', 0) for r in repos), dtype=np.float64, count=count)
+        sizes = np.fromiter((r.get('size', 0) for r in repos), dtype=np.float64, count=count)
+        age_days = np.fromiter(
+            (nan if d is None else d for d in (self._days_since(r.get('created_at'), now) for r in repos)),
+            dtype=np.float64, count=count)
+        push_days = np.fromiter(
+            (nan if d is None else d for d in (self._days_since(r.get('pushed_at'), now) for r in repos)),
+            dtype=np.float64, count=count)
+        
+        license_scores = np.fromiter((self._score_license(r.get('license')) for r in repos),
+                                     dtype=np.float64, count=count)
+        
+        if (_numba_score_batch is not None and count >= self._NUMBA_MIN_BATCH
+                and tuple(self.weights) == self._FACTORS):
+            starts, bases, spans = (np.array(column, dtype=np.float64) for column in zip(*self._AGE_SEGMENTS))
+            matrix, overall = _numba_score_batch(
+                stars, sizes, age_days, push_days, license_scores,
+                np.fromiter(self.weights.values(), dtype=np.float64, count=len(self.weights)),
+                np.array(self._AGE_THRESH, dtype=np.float64), starts, bases, spans,
+                np.array(self._ACTIVITY_THRESH, dtype=np.float64),
+                np.array(self._ACTIVITY_SCORES, dtype=np.float64),
+            )
+            components = dict(zip(self._FACTORS, matrix.T))
+        else:
+            components = {
+                'stars': np.where(stars > 0, np.minimum(np.log10(np.maximum(stars, 0) + 1) / 3.0, 1.0), 0.0),
+                'age': self._age_scores(age_days),
+                'commits': np.where(sizes > 0, np.minimum(np.log10(np.maximum(sizes, 0) + 1) / 4.0, 1.0), 0.0),
+                'license': license_scores,
+                'activity': self._activity_scores(push_days),
+            }
+            
+            # Weighted overall score, accumulated in the same order as
+            # score_repository() so scores on a level boundary round alike
+            overall = np.zeros(count)
+            for factor, weight in self.weights.items():
+                overall += components[factor] * weight
+        
+        columns = {f'{factor}_score': values.tolist() for factor, values in components.items()}
+        return [
+            {
+                'overall_score': round(score, 3),
+                'component_scores': {name: values[i] for name, values in columns.items()},
+                'trustworthiness': self._get_trustworthiness_level(score),
+            }
+            for i, score in enumerate(overall.tolist())
+        ]
+    
+    def _age_scores(self, age_days: 'np.ndarray') -> 'np.ndarray':
+        """Vectorized _score_age() over ages in days (NaN where unknown).
+        
+        Args:
+            age_days: Repository ages in days
+            
+        Returns:
+            Array of scores between 0 and 1
+        """
+        starts, bases, spans = (np.array(column, dtype=np.float64) for column in zip(*self._AGE_SEGMENTS))
+        idx = np.searchsorted(self._AGE_THRESH, age_days, side='right')
+        scores = np.minimum(bases[idx] + (age_days - starts[idx]) / spans[idx] * 0.25, 1.0)
+        return np.where(np.isnan(age_days), 0.0, scores)
+    
+    def _activity_scores(self, push_days: 'np.ndarray') -> 'np.ndarray':
+        """Vectorized _score_activity() over days since last push (NaN where unknown).
+        
+        Args:
+            push_days: Days since each repository's last push
+            
+        Returns:
+            Array of scores between 0 and 1
+        """
+        idx = np.searchsorted(self._ACTIVITY_THRESH, push_days, side='right')
+        scores = np.asarray(self._ACTIVITY_SCORES, dtype=np.float64)[idx]
+        return np.where(np.isnan(push_days), 0.0, scores)
+    
+    def _days_since(self, timestamp: str, now: datetime) -> Optional[int]:
+        """Whole days elapsed between an ISO timestamp and now.
+        
+        Args:
+            timestamp: ISO format date string
+            now: Reference time
+            
+        Returns:
+            Number of days, or None if timestamp is missing or invalid
+        """
+        if not timestamp:
+            return None
+        try:
+            return (now - self._parse_iso(timestamp)).days
+        except (ValueError, AttributeError):
+            return None
+    
     def _score_stars(self, stars: int) -> float:
         """Score based on star count (logarithmic scale).
         
@@ -65,33 +230,44 @@ class RepoScorer:
         score = math.log10(stars + 1) / 3.0
         return min(score, 1.0)
     
-    def _score_age(self, created_at: str) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+        
+        Results are memoized, since the same timestamps recur across scoring
+        runs.
+        
+        Args:
+            value: ISO format date string
+            
+        Returns:
+            Parsed datetime
+            
+        Raises:
+            ValueError: If value is not a valid ISO timestamp
+        """
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+    
+    def _score_age(self, created_at: str, now: Optional[datetime] = None) -> float:
         """Score based on repository age.
         
         Args:
             created_at: ISO format creation date
+            now: Reference time (default: current UTC time)
             
         Returns:
             Score between 0 and 1
         """
-        if not created_at:
+        age_days = self._days_since(created_at, now or datetime.now(timezone.utc))
+        if age_days is None:
             return 0.0
         
-        try:
-            created = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            age_days = (datetime.now(timezone.utc) - created).days
-            
-            # Linear scoring: 30 days = 0.25, 180 days = 0.5, 365 days = 0.75, 730+ days = 1.0
-            if age_days < 30:
-                return 0.25
-            elif age_days < 180:
-                return 0.25 + (age_days - 30) / 150 * 0.25
-            elif age_days < 365:
-                return 0.5 + (age_days - 180) / 185 * 0.25
-            else:
-                return min(0.75 + (age_days - 365) / 365 * 0.25, 1.0)
-        except (ValueError, AttributeError):
-            return 0.0
+        # Linear scoring: 30 days = 0.25, 180 days = 0.5, 365 days = 0.75, 730+ days = 1.0
+        start, base, span = self._AGE_SEGMENTS[bisect_right(self._AGE_THRESH, age_days)]
+        return min(base + (age_days - start) / span * 0.25, 1.0)
     
     def _score_commits(self, repo_info: Dict[str, Any]) -> float:
         """Score based on commit activity (estimated from repo size).
@@ -121,52 +297,24 @@ class RepoScorer:
         Returns:
             Score between 0 and 1
         """
-        if not license_name:
-            return 0.0
-        
-        # Preferred open source licenses get higher scores
-        preferred_licenses = {
-            'MIT License': 1.0,
-            'Apache License 2.0': 1.0,
-            'GNU General Public License v3.0': 0.9,
-            'BSD 3-Clause "New" or "Revised" License': 1.0,
-            'BSD 2-Clause "Simplified" License': 1.0,
-        }
-        
-        return preferred_licenses.get(license_name, 0.7)
+        return self._LICENSE_SCORES.get(license_name, 0.7) if license_name else 0.0
     
-    def _score_activity(self, repo_info: Dict[str, Any]) -> float:
+    def _score_activity(self, repo_info: Dict[str, Any], now: Optional[datetime] = None) -> float:
         """Score based on recent activity.
         
         Args:
             repo_info: Repository information
+            now: Reference time (default: current UTC time)
             
         Returns:
             Score between 0 and 1
         """
-        pushed_at = repo_info.get('pushed_at')
-        if not pushed_at:
+        days_since_push = self._days_since(repo_info.get('pushed_at'), now or datetime.now(timezone.utc))
+        if days_since_push is None:
             return 0.0
         
-        try:
-            last_push = datetime.fromisoformat(pushed_at.replace('Z', '+00:00'))
-            days_since_push = (datetime.now(timezone.utc) - last_push).days
-            
-            # Recent activity gets higher scores
-            if days_since_push < 7:
-                return 1.0
-            elif days_since_push < 30:
-                return 0.9
-            elif days_since_push < 90:
-                return 0.7
-            elif days_since_push < 180:
-                return 0.5
-            elif days_since_push < 365:
-                return 0.3
-            else:
-                return 0.1
-        except (ValueError, AttributeError):
-            return 0.0
+        # Recent activity gets higher scores
+        return self._ACTIVITY_SCORES[bisect_right(self._ACTIVITY_THRESH, days_since_push)]
     
     def _get_trustworthiness_level(self, score: float) -> str:
         """Convert numeric score to trustworthiness level.
@@ -177,13 +325,4 @@ class RepoScorer:
         Returns:
             Trustworthiness level string
         """
-        if score >= 0.8:
-            return 'high'
-        elif score >= 0.6:
-            return 'medium-high'
-        elif score >= 0.4:
-            return 'medium'
-        elif score >= 0.2:
-            return 'low-medium'
-        else:
-            return 'low'
+        return self._LEVELS[bisect_right(self._LEVEL_CUTOFFS, score)]
@@ -0,0 +1,76 @@
+"""Numba-compiled kernel for batch repository scoring.
+
+Importing this module requires numba; RepoScorer falls back to the NumPy
+implementation when it is not installed.
+"""
+import math
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def score_batch(stars, sizes, age_days, push_days, license_scores, weights,
+                age_thresh, age_starts, age_bases, age_spans,
+                activity_thresh, activity_scores):
+    """Compute component and overall scores for a batch in one fused loop.
+    
+    Component columns are ordered stars, age, commits, license, activity,
+    matching ``weights``. Unknown ages and push times are NaN and score 0.
+    
+    Args:
+        stars: Star counts (float64)
+        sizes: Repository sizes in KB (float64)
+        age_days: Days since creation (float64, NaN if unknown)
+        push_days: Days since last push (float64, NaN if unknown)
+        license_scores: Pre-computed license scores (float64)
+        weights: Weight of each component (float64, length 5)
+        age_thresh: Age thresholds in days where each segment starts
+        age_starts: Start day of each age segment
+        age_bases: Base score of each age segment
+        age_spans: Days per additional 0.25 in each age segment
+        activity_thresh: Days-since-push thresholds
+        activity_scores: Score of each activity band
+        
+    Returns:
+        Tuple of (components array of shape (n, 5), overall scores array)
+    """
+    n = stars.shape[0]
+    components = np.empty((n, 5))
+    overall = np.empty(n)
+    
+    for i in range(n):
+        s = stars[i]
+        stars_score = min(math.log10(s + 1.0) / 3.0, 1.0) if s > 0 else 0.0
+        
+        d = age_days[i]
+        if d != d:
+            age_score = 0.0
+        else:
+            j = 0
+            while j < age_thresh.shape[0] and d >= age_thresh[j]:
+                j += 1
+            age_score = min(age_bases[j] + (d - age_starts[j]) / age_spans[j] * 0.25, 1.0)
+        
+        size = sizes[i]
+        commits_score = min(math.log10(size + 1.0) / 4.0, 1.0) if size > 0 else 0.0
+        
+        p = push_days[i]
+        if p != p:
+            activity_score = 0.0
+        else:
+            j = 0
+            while j < activity_thresh.shape[0] and p >= activity_thresh[j]:
+                j += 1
+            activity_score = activity_scores[j]
+        
+        components[i, 0] = stars_score
+        components[i, 1] = age_score
+        components[i, 2] = commits_score
+        components[i, 3] = license_scores[i]
+        components[i, 4] = activity_score
+        overall[i] = (stars_score * weights[0] + age_score * weights[1]
+                      + commits_score * weights[2] + license_scores[i] * weights[3]
+                      + activity_score * weights[4])
+    
+    return components, overall
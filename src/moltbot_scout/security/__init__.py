@@ -1,18 +1,444 @@
 """Static security scanner module."""
+import mmap
 import os
 import re
-from typing import List, Dict, Any, Pattern
+import signal
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate, islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Pattern, Tuple, Union
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+try:
+    import re2  # google-re2: linear-time matching, no catastrophic backtracking
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # pyahocorasick: all prefilter literals in one pass
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Repositories with fewer files than this are scanned serially
+_PARALLEL_MIN_FILES = 64
+
+# Extensions scanned when scan_repository() is given none
+_DEFAULT_EXTENSIONS = ('.py',)
+
+# Leading bytes checked for NUL when sniffing binary files
+_BINARY_SNIFF_BYTES = 8192
+
+# Files at least this large are memory-mapped and matched as bytes
+_MMAP_MIN_SIZE = 65536
+
+# Leading global inline flags, e.g. the "(?i)" in "(?i)token"
+_GLOBAL_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+_FLAG_LETTERS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+
+def build_pattern_union(patterns: List[Tuple[str, Union[str, Pattern]]]) -> Tuple[Pattern, List[Tuple[str, str]]]:
+    """Combine several patterns into one alternation scanned in a single pass.
+    
+    Each pattern becomes a named group ``p<index>``; a match's ``lastgroup``
+    identifies which pattern fired. Global inline flags are rewritten as
+    scoped groups so they only apply to their own pattern.
+    
+    Args:
+        patterns: List of (kind, pattern) tuples, e.g. ('secret', r'(?i)token')
+        
+    Returns:
+        Tuple of (compiled union pattern, list of (kind, original regex) by index)
+        
+    Raises:
+        ValueError: If patterns is empty (the union would match everywhere)
+    """
+    if not patterns:
+        raise ValueError("Cannot build a union of no patterns")
+    
+    parts = []
+    pattern_meta = []
+    
+    for idx, (kind, pattern) in enumerate(patterns):
+        compiled = re.compile(pattern)
+        parts.append(f'(?P<p{idx}>{_scoped_source(compiled)})')
+        pattern_meta.append((kind, compiled.pattern))
+    
+    return re.compile('|'.join(parts)), pattern_meta
+
+
+def _scoped_source(pattern: Union[str, Pattern]) -> str:
+    """Rewrite a pattern's global flags as a scoped group around its body.
+    
+    Args:
+        pattern: Regex pattern (string or pre-compiled)
+        
+    Returns:
+        Regex source that matches the same text without global flags, e.g.
+        ``(?i:token)`` for ``(?i)token``
+    """
+    compiled = re.compile(pattern)
+    body = _GLOBAL_FLAGS.sub('', compiled.pattern, count=1)
+    letters = ''.join(letter for flag, letter in _FLAG_LETTERS if compiled.flags & flag)
+    return f'(?{letters}:{body})' if letters else body
+
+
+_REPEATS = tuple(op for op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT,
+                                getattr(_sre_parse, 'POSSESSIVE_REPEAT', None)) if op is not None)
+
+
+def _required_literals(pattern: Union[str, Pattern]) -> Optional[List[Tuple[str, bool]]]:
+    """Find literal substrings that any match of a pattern must contain.
+    
+    Args:
+        pattern: Regex pattern (string or pre-compiled)
+        
+    Returns:
+        List of (literal, ignore_case) tuples, at least one of which occurs in
+        every match, or None if no such literal can be derived
+    """
+    compiled = re.compile(pattern)
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except Exception:
+        return None
+    return _sequence_literals(parsed, bool(parsed.state.flags & re.IGNORECASE))
+
+
+def _sequence_literals(items, ignore_case: bool) -> Optional[List[Tuple[str, bool]]]:
+    """Pick the most selective required literal set from a parsed sequence.
+    
+    Args:
+        items: Parsed regex sequence of (opcode, argument) tuples
+        ignore_case: Whether the sequence is matched case-insensitively
+        
+    Returns:
+        List of (literal, ignore_case) tuples, or None
+    """
+    candidates = []
+    run = []
+    
+    for op, av in items:
+        if op == _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            candidates.append([(''.join(run), ignore_case)])
+            run = []
+        
+        found = None
+        if op == _sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            sub_ignore = (ignore_case or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            found = _sequence_literals(sub, sub_ignore)
+        elif op == _sre_parse.BRANCH:
+            found = []
+            for branch in av[1]:
+                branch_literals = _sequence_literals(branch, ignore_case)
+                if branch_literals is None:
+                    found = None
+                    break
+                found.extend(branch_literals)
+        elif op in _REPEATS and av[0] >= 1:
+            found = _sequence_literals(av[2], ignore_case)
+        elif op == _sre_parse.IN and all(o == _sre_parse.LITERAL for o, _ in av):
+            found = [(chr(c), ignore_case) for _, c in av]
+        
+        if found:
+            candidates.append(found)
+    
+    if run:
+        candidates.append([(''.join(run), ignore_case)])
+    if not candidates:
+        return None
+    
+    # Longest shortest-literal wins; fewer alternatives breaks ties
+    return max(candidates, key=lambda c: (min(len(lit) for lit, _ in c), -len(c)))
+
+
+def _pattern_literals(pattern: Union[str, Pattern]) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Split a pattern's required literals by case sensitivity.
+    
+    Args:
+        pattern: Regex pattern (string or pre-compiled)
+        
+    Returns:
+        Tuple of (case-sensitive literals, casefolded literals), at least one
+        of which occurs in any match, or None if the pattern has no required
+        literal
+    """
+    literals = _required_literals(pattern)
+    if literals is None:
+        return None
+    cased = {literal for literal, ignore_case in literals if not ignore_case}
+    caseless = {literal.casefold() for literal, ignore_case in literals if ignore_case}
+    return tuple(sorted(cased)), tuple(sorted(caseless))
+
+
+def _build_prefilter(patterns: List[Pattern]) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Collect the literals that gate a category's pattern union.
+    
+    Args:
+        patterns: Compiled patterns of one category
+        
+    Returns:
+        Tuple of (case-sensitive matcher, casefolded matcher) as built by
+        _literal_matcher(), or None if some pattern has no required literal
+        and the union must always run
+    """
+    cased, caseless = set(), set()
+    for pattern in patterns:
+        literals = _pattern_literals(pattern)
+        if literals is None:
+            return None
+        cased.update(literals[0])
+        caseless.update(literals[1])
+    
+    # A literal containing a shorter one is implied by it
+    cased = {lit for lit in cased if not any(o != lit and o in lit for o in cased)}
+    caseless = {lit for lit in caseless if not any(o != lit and o in lit for o in caseless)}
+    return _literal_matcher(cased), _literal_matcher(caseless)
+
+
+def _literal_matcher(literals: Iterable[str]) -> Union[Tuple[str, ...], Any]:
+    """Build a matcher for a set of literals.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so the
+    text is walked once however many literals there are; otherwise the
+    sorted literal tuple is probed with ``in``.
+    
+    Args:
+        literals: Literal substrings
+        
+    Returns:
+        ahocorasick.Automaton, or tuple of literals
+    """
+    literals = tuple(sorted(literals))
+    if ahocorasick is None or not literals:
+        return literals
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_any(text: str, matcher: Union[Tuple[str, ...], Any]) -> bool:
+    """Check whether text contains any literal of a matcher.
+    
+    Args:
+        text: Text to search
+        matcher: Result of _literal_matcher()
+        
+    Returns:
+        True if at least one literal occurs in text
+    """
+    if isinstance(matcher, tuple):
+        return any(literal in text for literal in matcher)
+    return next(matcher.iter(text), None) is not None
+
+
+def _line_starts(lines: List[str]) -> List[int]:
+    """Offsets at which each line starts, for bisecting match positions.
+    
+    Args:
+        lines: Content split on '\n'
+        
+    Returns:
+        Sorted list of line start offsets; bisect_right(starts, pos) is the
+        1-based line number of offset pos
+    """
+    return list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+
+def _line_numbers(content: str, lines: List[str], starts: List[int]) -> List[int]:
+    """Map match offsets to 1-based line numbers.
+    
+    With NumPy the newline offsets are found in one vectorized pass and all
+    offsets are looked up in a single searchsorted call; otherwise line
+    start offsets are built from lines and bisected.
+    
+    Args:
+        content: File content
+        lines: Content split on '\n'
+        starts: Character offsets of matches
+        
+    Returns:
+        Line number of each offset
+    """
+    if np is None:
+        line_starts = _line_starts(lines)
+        return [bisect_right(line_starts, start) for start in starts]
+    
+    # One array element per character, so indexes are character offsets
+    if content.isascii():
+        codes = np.frombuffer(content.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32)
+    newlines = np.flatnonzero(codes == 10)
+    return (np.searchsorted(newlines, starts, side='left') + 1).tolist()
+
+
+def _byte_literals(patterns: List[Pattern]) -> Optional[Tuple[bytes, ...]]:
+    """Collect UTF-8 prefilter literals for scanning undecoded bytes.
+    
+    Args:
+        patterns: Compiled patterns of one category
+        
+    Returns:
+        Tuple of literals, at least one of which occurs in any match, or None
+        if the category must always be scanned (a pattern has no required
+        literal, or one is case-insensitive and cannot be found without
+        lowercasing the whole file)
+    """
+    found = set()
+    for pattern in patterns:
+        literals = _required_literals(pattern)
+        if literals is None or any(ignore_case for _, ignore_case in literals):
+            return None
+        found.update(literal.encode('utf-8') for literal, _ in literals)
+    return tuple(sorted(found))
+
+
+def _byte_lines(data: Union[bytes, mmap.mmap], starts: List[int]) -> List[Tuple[int, int, int]]:
+    """Locate the lines containing byte offsets.
+    
+    Args:
+        data: File bytes or memory map
+        starts: Byte offsets of matches
+        
+    Returns:
+        (1-based line number, line start, line end) for each offset
+    """
+    if np is not None:
+        newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10).tolist()
+    else:
+        newlines = []
+        pos = data.find(b'\n')
+        while pos != -1:
+            newlines.append(pos)
+            pos = data.find(b'\n', pos + 1)
+    
+    spans = []
+    for start in starts:
+        idx = bisect_left(newlines, start)
+        line_start = newlines[idx - 1] + 1 if idx else 0
+        line_end = newlines[idx] if idx < len(newlines) else len(data)
+        spans.append((idx + 1, line_start, line_end))
+    return spans
+
+
+def _first_per_line(matches: Iterable[Any], content: Union[str, mmap.mmap],
+                    newline: Union[str, bytes]) -> Iterator[int]:
+    """Drop matches on the same line as the previous one.
+    
+    Args:
+        matches: One pattern's matches over content, in order
+        content: Text or bytes the matches were found in
+        newline: Line separator of content
+        
+    Yields:
+        Start offset of the first match on each line
+    """
+    line_end = -1
+    for match in matches:
+        start = match.start()
+        if start <= line_end:
+            continue
+        line_end = content.find(newline, start)
+        if line_end == -1:
+            line_end = len(content)
+        yield start
+
+
+class _ScanTimeout(Exception):
+    """Raised when scanning a single file exceeds its time budget."""
+
+
+@contextmanager
+def _time_limit(seconds: int):
+    """Abort the enclosed block after ``seconds`` via SIGALRM.
+    
+    Only active on POSIX in the main thread; elsewhere it is a no-op.
+    
+    Args:
+        seconds: Time budget in whole seconds (0 or None disables the limit)
+    """
+    if (not seconds or not hasattr(signal, 'SIGALRM')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+    
+    def _on_alarm(signum, frame):
+        raise _ScanTimeout(f'exceeded {seconds}s')
+    
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
 
 
 class SecurityScanner:
     """Scans repositories for security issues without execution."""
     
-    def __init__(self, secret_patterns: List[str] = None, suspicious_patterns: List[str] = None):
+    # Result list and finding type for each pattern category
+    _CATEGORY_OUTPUT = {
+        'secret': ('secrets', 'potential_secret'),
+        'suspicious': ('suspicious', 'suspicious_code'),
+    }
+    
+    def __init__(self, secret_patterns: List[Union[str, Pattern]] = None,
+                 suspicious_patterns: List[Union[str, Pattern]] = None,
+                 pattern_unions: Dict[str, Tuple[Pattern, List[Tuple[str, str]]]] = None,
+                 re2_incompatible_patterns: List[str] = None, scan_timeout: int = 2,
+                 max_workers: Optional[int] = None, max_file_size: int = 1048576,
+                 max_findings_per_file: Optional[int] = 100):
         """Initialize security scanner.
         
+        Each category's patterns are fused into one alternation. With RE2 it
+        gates the category: a file is only scanned pattern by pattern when the
+        union matches somewhere in it. A union cannot supply the findings itself,
+        since a match of one pattern hides overlapping matches of the others
+        (``GITHUB_TOKEN = "..."`` is both a GitHub token and a token value).
+        Categories and patterns are further gated on literals they require
+        (e.g. "eval" for ``eval\s*\(``), which skips the regex engine for most
+        clean files.
+        
+        When google-re2 is installed, patterns are matched with RE2, which runs
+        in linear time. RE2 rejects backreferences and lookaround; if any pattern
+        is listed in ``re2_incompatible_patterns`` (or RE2 fails to compile the
+        set) the stdlib engine is used instead, with a per-file time limit.
+        
         Args:
-            secret_patterns: Regex patterns for detecting secrets
-            suspicious_patterns: Regex patterns for detecting suspicious code
+            secret_patterns: Regex patterns (strings or pre-compiled) for detecting secrets
+            suspicious_patterns: Regex patterns (strings or pre-compiled) for detecting suspicious code
+            pattern_unions: Pre-built build_pattern_union() results for the same
+                patterns, keyed by 'secret' and 'suspicious'
+            re2_incompatible_patterns: Patterns known to need the stdlib engine
+            scan_timeout: Per-file time limit in seconds for the stdlib engine
+                (enforced with SIGALRM, so only when scanning in the main thread)
+            max_workers: Threads used to scan large repositories with RE2
+                (default: CPU count); 1 always scans in the calling thread. The
+                stdlib engine holds the GIL and always scans serially, which
+                keeps its time limit in force
+            max_file_size: Files larger than this (bytes) are skipped, as are
+                binary files (default: 1MB)
+            max_findings_per_file: Findings kept per category and file; files
+                with more are reported in 'truncated_files' (None: no limit)
         """
         self.secret_patterns = [
             re.compile(pattern) for pattern in (secret_patterns or self._default_secret_patterns())
@@ -20,13 +446,105 @@ class SecurityScanner:
         self.suspicious_patterns = [
             re.compile(pattern) for pattern in (suspicious_patterns or self._default_suspicious_patterns())
         ]
+        # Findings come from these patterns; pattern_id indexes their category's list
+        self.patterns = {
+            'secret': self.secret_patterns,
+            'suspicious': self.suspicious_patterns,
+        }
+        
+        # Pre-built unions are only used if they were built from exactly
+        # these patterns (e.g. not from an empty config list the defaults
+        # replaced); otherwise they are rebuilt here
+        pattern_unions = pattern_unions or {}
+        self.unions = {}
+        for kind, patterns in self.patterns.items():
+            union = pattern_unions.get(kind)
+            if union is None or [source for _, source in union[1]] != [p.pattern for p in patterns]:
+                union = build_pattern_union([(kind, p) for p in patterns])
+            self.unions[kind] = union
+        # Findings carry a pattern_id indexing their category's list here
+        self.pattern_catalog = {
+            kind: [source for _, source in meta] for kind, (_, meta) in self.unions.items()
+        }
+        self.prefilters = {
+            kind: _build_prefilter(patterns) for kind, patterns in self.patterns.items()
+        }
+        self.pattern_literals = {
+            kind: [_pattern_literals(p) for p in patterns] for kind, patterns in self.patterns.items()
+        }
+        # Per-pattern matchers on the active engine
+        self.matchers = dict(self.patterns)
+        self.uses_re2 = False
+        self.scan_timeout = scan_timeout
+        self.max_workers = max_workers
+        self.max_file_size = max_file_size
+        self.max_findings_per_file = max_findings_per_file
+        
+        if re2 is not None:
+            incompatible = set(re2_incompatible_patterns or [])
+            sources = [source for _, meta in self.unions.values() for _, source in meta]
+            if not any(source in incompatible for source in sources):
+                try:
+                    unions = {
+                        kind: (re2.compile(union.pattern), meta)
+                        for kind, (union, meta) in self.unions.items()
+                    }
+                    matchers = {
+                        kind: [re2.compile(_scoped_source(p)) for p in patterns]
+                        for kind, patterns in self.patterns.items()
+                    }
+                    self.unions, self.matchers = unions, matchers
+                    self.uses_re2 = True
+                except re2.error:
+                    pass
+        
+        # Byte-level unions and patterns for memory-mapped scans of large files
+        self.byte_unions = self._compile_byte_unions()
+        self.byte_prefilters = {
+            kind: _byte_literals(patterns) for kind, patterns in self.patterns.items()
+        }
+        self.byte_pattern_literals = {
+            kind: [_byte_literals([p]) for p in patterns] for kind, patterns in self.patterns.items()
+        }
+    
+    def _compile_byte_unions(self) -> Optional[Dict[str, Tuple[Pattern, List[Pattern]]]]:
+        """Compile each category's union and patterns as bytes patterns on the active engine.
+        
+        Returns:
+            Dictionary mapping category to (bytes union, bytes patterns), or
+            None if a pattern contains non-ASCII text (its bytes form would
+            match differently) or fails to compile; large files are then
+            decoded like any other
+        """
+        engine = re2 if self.uses_re2 else re
+        errors = (UnicodeEncodeError, re.error) + ((re2.error,) if re2 is not None else ())
+        try:
+            return {
+                kind: (engine.compile(union.pattern.encode('ascii')),
+                       [engine.compile(_scoped_source(p).encode('ascii')) for p in self.patterns[kind]])
+                for kind, (union, _) in self.unions.items()
+            }
+        except errors:
+            return None
+    
+    def describe_pattern(self, kind: str, pattern_id: int) -> str:
+        """Look up the regex behind a finding's pattern_id.
+        
+        Args:
+            kind: Pattern category, 'secret' or 'suspicious'
+            pattern_id: The finding's pattern_id
+            
+        Returns:
+            Source text of the pattern
+        """
+        return self.pattern_catalog[kind][pattern_id]
     
     def _default_secret_patterns(self) -> List[str]:
         """Get default secret detection patterns."""
         return [
-            r'(?i)(api[_-]?key|apikey)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,}[\'"]',
-            r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*[\'"][^\'"]{8,}[\'"]',
-            r'(?i)(token|auth)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,}[\'"]',
+            r'(?i)(api[_-]?key|apikey)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,256}[\'"]',
+            r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*[\'"][^\'"\n]{8,256}[\'"]',
+            r'(?i)(token|auth)\s*[:=]\s*[\'"][a-zA-Z0-9]{20,256}[\'"]',
             r'(?i)(private[_-]?key)\s*[:=]',
             r'(?i)(aws[_-]?access[_-]?key|aws[_-]?secret)',
             r'(?i)(github[_-]?token|gh[_-]?token)',
@@ -46,46 +564,79 @@ class SecurityScanner:
             r'marshal\.loads',
         ]
     
-    def scan_repository(self, repo_path: str, file_extensions: List[str] = None) -> Dict[str, Any]:
+    def scan_repository(self, repo_path: str,
+                        file_extensions: Union[str, Iterable[str]] = None) -> Dict[str, Any]:
         """Scan a repository for security issues.
         
+        With RE2, repositories with more than _PARALLEL_MIN_FILES matching
+        files are scanned across a thread pool; findings are merged in walk
+        order either way. The stdlib engine gains nothing from threads (it
+        holds the GIL while matching) and its time limit needs the main
+        thread, so it always scans serially.
+        
         Args:
             repo_path: Path to cloned repository
-            file_extensions: List of file extensions to scan (default: ['.py'])
+            file_extensions: File extension or extensions to scan (default: '.py')
             
         Returns:
             Dictionary with scan results
         """
+        # str.endswith() takes a tuple and tests every suffix in C
         if file_extensions is None:
-            file_extensions = ['.py']
+            exts = _DEFAULT_EXTENSIONS
+        elif isinstance(file_extensions, str):
+            exts = (file_extensions,)
+        else:
+            exts = tuple(file_extensions)
         
         results = {
             'secrets_found': [],
             'suspicious_code': [],
             'files_scanned': 0,
             'total_issues': 0,
+            'truncated_files': [],
+            'pattern_catalog': self.pattern_catalog,
         }
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip .git directory
-            if '.git' in dirs:
-                dirs.remove('.git')
-            
-            for file in files:
-                if any(file.endswith(ext) for ext in file_extensions):
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, repo_path)
-                    
-                    file_results = self._scan_file(file_path, rel_path)
-                    results['secrets_found'].extend(file_results['secrets'])
-                    results['suspicious_code'].extend(file_results['suspicious'])
-                    results['files_scanned'] += 1
+        # Walk with os.scandir in os.walk top-down order: the directory read
+        # supplies file types, and relative paths are built as we descend
+        file_paths = []
+        rel_paths = []
+        stack = [(repo_path, '')]
+        while stack:
+            path, rel_prefix = stack.pop()
+            subdirs = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip .git directory
+                        if entry.name != '.git':
+                            subdirs.append((entry.path, rel_prefix + entry.name + os.sep))
+                    elif entry.name.endswith(exts) and entry.is_file():
+                        file_paths.append(entry.path)
+                        rel_paths.append(rel_prefix + entry.name)
+            stack.extend(reversed(subdirs))
+        
+        if self.uses_re2 and self.max_workers != 1 and len(file_paths) > _PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                scanned = list(executor.map(self._scan_file, file_paths, rel_paths))
+        else:
+            scanned = map(self._scan_file, file_paths, rel_paths)
+        
+        for rel_path, file_results in zip(rel_paths, scanned):
+            if file_results is None:
+                continue
+            results['secrets_found'].extend(file_results['secrets'])
+            results['suspicious_code'].extend(file_results['suspicious'])
+            results['files_scanned'] += 1
+            if file_results['truncated']:
+                results['truncated_files'].append(rel_path)
         
         results['total_issues'] = len(results['secrets_found']) + len(results['suspicious_code'])
         
         return results
     
-    def _scan_file(self, file_path: str, rel_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _scan_file(self, file_path: str, rel_path: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """Scan a single file for security issues.
         
         Args:
@@ -93,42 +644,192 @@ class SecurityScanner:
             rel_path: Relative path to file (for reporting)
             
         Returns:
-            Dictionary with secrets and suspicious code found
+            Dictionary with secrets and suspicious code found (and whether
+            either list was cut at max_findings_per_file), or None if the file
+            was skipped as too large or binary
         """
         results = {
             'secrets': [],
             'suspicious': [],
+            'truncated': False,
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.max_file_size:
+                    return None
+                
+                # Large files are matched in place as bytes rather than
+                # read and decoded into a str copy
+                if size >= _MMAP_MIN_SIZE and self.byte_unions is not None:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        if b'\x00' in data[:_BINARY_SNIFF_BYTES]:
+                            return None
+                        with _time_limit(0 if self.uses_re2 else self.scan_timeout):
+                            self._match_mapped(data, rel_path, results)
+                    return results
+                
+                raw = f.read(self.max_file_size + 1)
+                if len(raw) > self.max_file_size or b'\x00' in raw[:_BINARY_SNIFF_BYTES]:
+                    return None
                 
-                # Scan for secrets
-                for pattern in self.secret_patterns:
-                    for match in pattern.finditer(content):
-                        line_num = content[:match.start()].count('\n') + 1
-                        results['secrets'].append({
-                            'file': rel_path,
-                            'line': line_num,
-                            'type': 'potential_secret',
-                            'pattern': pattern.pattern,
-                            'context': lines[line_num - 1].strip() if line_num <= len(lines) else '',
-                        })
+                # Same text as a universal-newline read with errors='ignore'
+                content = raw.decode('utf-8', errors='ignore')
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                lines = content.split('\n')
                 
-                # Scan for suspicious code
-                for pattern in self.suspicious_patterns:
-                    for match in pattern.finditer(content):
-                        line_num = content[:match.start()].count('\n') + 1
-                        results['suspicious'].append({
-                            'file': rel_path,
-                            'line': line_num,
-                            'type': 'suspicious_code',
-                            'pattern': pattern.pattern,
-                            'context': lines[line_num - 1].strip() if line_num <= len(lines) else '',
-                        })
+                # One pass over the content per category; RE2 needs no time
+                # limit since it cannot backtrack
+                with _time_limit(0 if self.uses_re2 else self.scan_timeout):
+                    self._match_content(content, lines, rel_path, results)
+        except _ScanTimeout as e:
+            print(f"Scan of {rel_path} aborted: {e}")
         except Exception as e:
             print(f"Error scanning {rel_path}: {e}")
         
         return results
+    
+    def _match_content(self, content: str, lines: List[str], rel_path: str,
+                       results: Dict[str, List[Dict[str, Any]]]):
+        """Run the patterns whose gates pass over file content and record matches.
+        
+        Repeated matches of a pattern on the same line are recorded once.
+        
+        Args:
+            content: File content
+            lines: Content split into lines
+            rel_path: Relative path to file (for reporting)
+            results: Dictionary with 'secrets' and 'suspicious' lists to extend
+        """
+        folded = None
+        gated = []
+        for kind, (union, _) in self.unions.items():
+            prefilter = self.prefilters.get(kind)
+            if prefilter is not None:
+                cased, caseless = prefilter
+                if caseless and folded is None:
+                    folded = content.casefold()
+                if not (_contains_any(content, cased) or _contains_any(folded, caseless)):
+                    continue
+            # RE2 checks the whole union in one linear pass; the stdlib engine
+            # retries every alternative at each position, which costs about
+            # as much as the per-pattern scans it would save
+            if self.uses_re2 and union.search(content) is None:
+                continue
+            
+            for pattern_id, (matcher, literals) in enumerate(zip(self.matchers[kind],
+                                                                 self.pattern_literals[kind])):
+                if literals is not None:
+                    cased, caseless = literals
+                    if caseless and folded is None:
+                        folded = content.casefold()
+                    if not (any(lit in content for lit in cased) or any(lit in folded for lit in caseless)):
+                        continue
+                gated.append((kind, pattern_id, matcher))
+        
+        matches, results['truncated'] = self._cap_matches(self._pattern_matches(content, gated))
+        if not matches:
+            return
+        
+        line_nums = _line_numbers(content, lines, [start for _, _, start in matches])
+        for (kind, pattern_id, _), line_num in zip(matches, line_nums):
+            results_key, finding_type = self._CATEGORY_OUTPUT[kind]
+            results[results_key].append({
+                'file': rel_path,
+                'line': line_num,
+                'type': finding_type,
+                'pattern_id': pattern_id,
+                'context': lines[line_num - 1].strip() if line_num <= len(lines) else '',
+            })
+    
+    def _match_mapped(self, data: mmap.mmap, rel_path: str,
+                      results: Dict[str, List[Dict[str, Any]]]):
+        """Run the byte-level patterns whose gates pass over a memory-mapped file and record matches.
+        
+        Line numbers and contexts match those of a decoded scan, except that
+        a lone '\r' is not treated as a line break.
+        
+        Args:
+            data: Memory map of the file
+            rel_path: Relative path to file (for reporting)
+            results: Dictionary with 'secrets' and 'suspicious' lists to extend
+        """
+        gated = []
+        for kind, (union, matchers) in self.byte_unions.items():
+            literals = self.byte_prefilters.get(kind)
+            if literals is not None and all(data.find(literal) == -1 for literal in literals):
+                continue
+            if self.uses_re2 and union.search(data) is None:
+                continue
+            
+            for pattern_id, (matcher, literals) in enumerate(zip(matchers, self.byte_pattern_literals[kind])):
+                if literals is not None and all(data.find(literal) == -1 for literal in literals):
+                    continue
+                gated.append((kind, pattern_id, matcher))
+        
+        matches, results['truncated'] = self._cap_matches(self._pattern_matches(data, gated))
+        if not matches:
+            return
+        
+        spans = _byte_lines(data, [start for _, _, start in matches])
+        for (kind, pattern_id, _), (line_num, line_start, line_end) in zip(matches, spans):
+            results_key, finding_type = self._CATEGORY_OUTPUT[kind]
+            results[results_key].append({
+                'file': rel_path,
+                'line': line_num,
+                'type': finding_type,
+                'pattern_id': pattern_id,
+                'context': data[line_start:line_end].decode('utf-8', errors='ignore').strip(),
+            })
+    
+    def _cap_matches(self, matches: Iterable[Tuple[str, int, int]]) -> Tuple[List[Tuple[str, int, int]], bool]:
+        """Keep at most max_findings_per_file matches of each category.
+        
+        Args:
+            matches: (kind, pattern_id, match start) tuples
+            
+        Returns:
+            Tuple of (kept matches, whether any were dropped)
+        """
+        limit = self.max_findings_per_file
+        if not limit:
+            return list(matches), False
+        
+        kept = []
+        counts = dict.fromkeys(self.unions, 0)
+        truncated = False
+        for item in matches:
+            if counts[item[0]] < limit:
+                counts[item[0]] += 1
+                kept.append(item)
+            else:
+                truncated = True
+                if all(count >= limit for count in counts.values()):
+                    break
+        return kept, truncated
+    
+    def _pattern_matches(self, content: Union[str, mmap.mmap],
+                         gated: List[Tuple[str, int, Pattern]]) -> Iterator[Tuple[str, int, int]]:
+        """Scan content once per pattern that passed its gates.
+        
+        Only the first match of a pattern on each line is kept, and each
+        pattern stops one kept match past max_findings_per_file, which is
+        enough for _cap_matches() to see its category was cut.
+        
+        Args:
+            content: File content (text, or a memory map for byte patterns)
+            gated: (kind, pattern_id, matcher) triples of the patterns to run
+            
+        Yields:
+            (kind, pattern_id, match start) tuples, in pattern order
+        """
+        limit = self.max_findings_per_file
+        newline = '\n' if isinstance(content, str) else b'\n'
+        for kind, pattern_id, matcher in gated:
+            found = _first_per_line(matcher.finditer(content), content, newline)
+            if limit:
+                found = islice(found, limit + 1)
+            for start in found:
+                yield kind, pattern_id, start
@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 """Test script to verify moltbot-repo-scout functionality without GitHub API."""
+import copy
 import os
 import sys
 import json
+import math
 import tempfile
+import threading
 import shutil
+from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from moltbot_scout.cli import _search_cache_path
+from moltbot_scout.discovery import RepoDiscovery
 from moltbot_scout.scoring import RepoScorer
 from moltbot_scout.security import SecurityScanner
 from moltbot_scout.parser import StrategyParser
 from moltbot_scout.normalizer import SpecNormalizer
 from moltbot_scout.indexer import ArtifactIndexer
-from moltbot_scout.config import Config
+from moltbot_scout.config import Config, _read_config_file
 
 
 def create_test_repo(temp_dir):
@@ -200,9 +207,112 @@ def test_scoring():
     for component, score in score_result['component_scores'].items():
         print(f"  {component}: {score:.3f}")
     
+    # Batch scoring matches per-repository scoring, on the NumPy path and
+    # (for large batches with the default weight order) the numba kernel
+    now = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    licenses = ['MIT License', 'GNU General Public License v3.0', 'Other', None]
+    repos = [
+        {
+            'full_name': f'test/repo-{i}',
+            'stars': (i * 37) % 5000,
+            'size': (i * 91) % 200000,
+            'created_at': None if i % 13 == 0 else f'{2015 + i % 11}-{1 + i % 12:02d}-15T10:00:00Z',
+            'pushed_at': None if i % 17 == 0 else f'2025-{1 + i % 12:02d}-{1 + i % 28:02d}T15:30:00Z',
+            'license': licenses[i % len(licenses)],
+        }
+        for i in range(RepoScorer._NUMBA_MIN_BATCH)
+    ]
+    reordered = RepoScorer(weights=dict(reversed(list(scorer.weights.items()))))
+    for batch_scorer, batch in ((scorer, repos[:50]), (reordered, repos), (scorer, repos)):
+        for repo, batch_result in zip(batch, batch_scorer.score_repositories(batch, now)):
+            expected = batch_scorer.score_repository(repo, now)
+            assert batch_result['overall_score'] == expected['overall_score'], repo
+            assert batch_result['trustworthiness'] == expected['trustworthiness'], repo
+            for name, value in expected['component_scores'].items():
+                assert math.isclose(batch_result['component_scores'][name], value, abs_tol=1e-12), (repo, name)
+    print(f"\nBatch scoring matches per-repository scoring ({len(repos)} repositories)")
+    
     print("\n✅ Scoring test passed!\n")
 
 
+def test_discovery_overlap():
+    """Test that a query mostly overlapping earlier ones stops after its first page."""
+    print("🔎 Testing Discovery Overlap Short-Circuit...\n")
+    
+    def fake_repo(i):
+        return SimpleNamespace(
+            full_name=f'test/repo-{i}', name=f'repo-{i}', owner=SimpleNamespace(login='test'),
+            description=None, html_url='', clone_url='', stargazers_count=i, forks_count=0,
+            created_at=None, updated_at=None, pushed_at=None, language='Python', license=None,
+            get_topics=lambda: [], default_branch='main', size=0, open_issues_count=0,
+        )
+    
+    class StubGithub:
+        """Serves search results lazily and counts how many were pulled."""
+        
+        def __init__(self, per_page):
+            self.per_page = per_page
+            self.pulled = 0
+        
+        def search_repositories(self, query, sort, order):
+            for i in range(100):
+                self.pulled += 1
+                yield fake_repo(i)
+    
+    # Results past the first page are skipped when that page is mostly known
+    discovery = RepoDiscovery(max_results_per_query=25, cache_path=None)
+    discovery.github = StubGithub(per_page=10)
+    known = {f'test/repo-{i}': {'full_name': f'test/repo-{i}'} for i in range(9)}
+    repos, truncated = discovery._search_repos('trading bot', known)
+    assert truncated and len(repos) == 10 and discovery.github.pulled == 10
+    assert repos[0] is known['test/repo-0']
+    
+    # Default sizes: the query asks for fewer results than a page holds, so
+    # the check runs once the query's results are in, and the result is
+    # complete (and cacheable) even when it overlaps
+    for max_results in (20, 30):
+        discovery = RepoDiscovery(max_results_per_query=max_results, cache_path=None)
+        discovery.github = StubGithub(per_page=30)
+        known = {f'test/repo-{i}': {'full_name': f'test/repo-{i}'} for i in range(max_results - 2)}
+        repos, truncated = discovery._search_repos('trading bot', known)
+        assert not truncated and len(repos) == max_results
+        assert discovery.github.pulled == max_results, "Overlap check did not run on the first page"
+    
+    # Little overlap: every requested result is returned
+    discovery = RepoDiscovery(max_results_per_query=25, cache_path=None)
+    discovery.github = StubGithub(per_page=10)
+    repos, truncated = discovery._search_repos('trading bot', {'test/repo-0': {'full_name': 'test/repo-0'}})
+    assert not truncated and len(repos) == 25
+    
+    print("\n✅ Discovery overlap test passed!\n")
+
+
+def test_discovery_cache(temp_dir):
+    """Test the search cache's location and connection lifetime."""
+    print("🔎 Testing Discovery Search Cache...\n")
+    
+    # Relative cache paths live under the artifacts directory, not the cwd
+    cfg = Config.from_dict({'github': {'cache_path': '.scout_cache.sqlite'},
+                            'output': {'artifacts_dir': os.path.join(temp_dir, 'artifacts')}})
+    cache_path = _search_cache_path(cfg)
+    assert cache_path == os.path.join(temp_dir, 'artifacts', '.scout_cache.sqlite')
+    assert _search_cache_path(Config.from_dict({'github': {'cache_path': ''}})) is None
+    
+    repos = [{'full_name': 'test/repo', 'stars': 1}]
+    with RepoDiscovery(cache_path=cache_path) as discovery:
+        key = discovery._cache_key('trading bot')
+        discovery._cache_put(key, repos)
+    assert discovery._cache is None, "Search cache connection left open"
+    
+    with RepoDiscovery(cache_path=cache_path) as discovery:
+        assert discovery._cache_get(key) == repos, "Search cache did not persist"
+        discovery.clear_cache()
+        assert discovery._cache_get(key) is None
+    
+    print(f"Search Cache: {os.path.relpath(cache_path, temp_dir)}")
+    print("\n✅ Discovery cache test passed!\n")
+
+
 def test_security_scanner(repo_path):
     """Test security scanning functionality."""
     print("🔒 Testing Security Scanner...\n")
@@ -227,11 +337,101 @@ def test_security_scanner(repo_path):
         suspicious = results['suspicious_code'][0]
         print(f"  File: {suspicious['file']}")
         print(f"  Line: {suspicious['line']}")
-        print(f"  Pattern: {suspicious['pattern']}")
+        print(f"  Pattern: {scanner.describe_pattern('suspicious', suspicious['pattern_id'])}")
     
     print("\n✅ Security scanner test passed!\n")
 
 
+def test_overlapping_patterns(temp_dir):
+    """Check that overlapping patterns are all reported, as per-pattern scans report them."""
+    print("🔒 Testing Overlapping Security Patterns...\n")
+    
+    repo_path = os.path.join(temp_dir, 'overlap_repo')
+    os.makedirs(repo_path)
+    sample = (
+        'GITHUB_TOKEN = "abcdefghijklmnopqrstuvwxyz0123"\n'
+        'AWS_SECRET = "not-a-real-secret"\n'
+        'data = eval(exec(payload))\n'
+    )
+    with open(os.path.join(repo_path, 'small.py'), 'w') as f:
+        f.write(sample)
+    # Large enough to be memory-mapped and matched as bytes
+    with open(os.path.join(repo_path, 'large.py'), 'w') as f:
+        f.write(sample + '# padding\n' * 8000 + sample)
+    
+    def scan(scanner):
+        results = scanner.scan_repository(repo_path)
+        return sorted(
+            (issue['file'], kind, issue['pattern_id'], issue['line'])
+            for kind, key in (('secret', 'secrets_found'), ('suspicious', 'suspicious_code'))
+            for issue in results[key]
+        )
+    
+    scanner = SecurityScanner(max_findings_per_file=None)
+    found = scan(scanner)
+    
+    # The union gate only runs on RE2; the stdlib engine (forced here by
+    # marking every pattern incompatible) must report the same findings
+    sources = [p.pattern for patterns in scanner.patterns.values() for p in patterns]
+    ungated = SecurityScanner(max_findings_per_file=None, re2_incompatible_patterns=sources)
+    assert not ungated.uses_re2
+    assert scan(ungated) == found, "Gated and ungated findings differ"
+    
+    expected = set()
+    for name in ('small.py', 'large.py'):
+        with open(os.path.join(repo_path, name)) as f:
+            content = f.read()
+        for kind, patterns in scanner.patterns.items():
+            for pattern_id, pattern in enumerate(patterns):
+                for match in pattern.finditer(content):
+                    line = content.count('\n', 0, match.start()) + 1
+                    expected.add((name, kind, pattern_id, line))
+    
+    assert found == sorted(expected), f"Overlapping findings differ: {found} != {sorted(expected)}"
+    print(f"Findings: {len(found)} (matches per-pattern scan)")
+    print("\n✅ Overlapping patterns test passed!\n")
+
+
+def test_scan_workers(temp_dir):
+    """Test that only RE2 scans use the thread pool, with unchanged findings."""
+    print("🧵 Testing Security Scan Workers...\n")
+    
+    repo_path = os.path.join(temp_dir, 'many_files_repo')
+    os.makedirs(repo_path)
+    for i in range(100):
+        with open(os.path.join(repo_path, f'module_{i}.py'), 'w') as f:
+            f.write(f'result = eval(payload_{i})\n')
+    
+    def scan_threads(scanner):
+        threads = set()
+        scan_file = scanner._scan_file
+        
+        def recording_scan_file(file_path, rel_path):
+            threads.add(threading.current_thread())
+            return scan_file(file_path, rel_path)
+        
+        scanner._scan_file = recording_scan_file
+        return scanner.scan_repository(repo_path), threads
+    
+    # The stdlib engine scans serially so its SIGALRM time limit stays in force
+    incompatible = SecurityScanner().suspicious_patterns[0].pattern
+    stdlib = SecurityScanner(re2_incompatible_patterns=[incompatible])
+    results, threads = scan_threads(stdlib)
+    assert not stdlib.uses_re2
+    assert threads == {threading.main_thread()}, "Stdlib scan left the main thread"
+    assert results['total_issues'] == 100
+    
+    scanner = SecurityScanner()
+    if scanner.uses_re2:
+        parallel, threads = scan_threads(scanner)
+        assert threading.main_thread() not in threads, "RE2 scan did not use the thread pool"
+        serial = SecurityScanner(max_workers=1).scan_repository(repo_path)
+        assert parallel['suspicious_code'] == serial['suspicious_code'], "Parallel findings differ"
+    
+    print(f"Files Scanned: {results['files_scanned']} (RE2: {scanner.uses_re2})")
+    print("\n✅ Scan workers test passed!\n")
+
+
 def test_parser(repo_path):
     """Test AST parser functionality."""
     print("🔍 Testing AST Parser...\n")
@@ -247,24 +447,69 @@ def test_parser(repo_path):
     if results['strategies']:
         print("\nSample Strategy:")
         strategy = results['strategies'][0]
-        print(f"  Name: {strategy['name']}")
-        print(f"  Type: {strategy['type']}")
-        print(f"  File: {strategy['file']}")
+        print(f"  Name: {strategy.name}")
+        print(f"  Type: {strategy.type}")
+        print(f"  File: {strategy.file}")
     
     if results['indicators']:
         print("\nSample Indicators:")
         for indicator in results['indicators'][:3]:
-            print(f"  - {indicator['name']} (line {indicator['line']})")
+            print(f"  - {indicator.name} (line {indicator.line})")
     
     if results['risk_logic']:
         print("\nRisk Management Functions:")
         for risk_func in results['risk_logic']:
-            print(f"  - {risk_func['name']} (line {risk_func['line']})")
+            print(f"  - {risk_func.name} (line {risk_func.line})")
     
     print("\n✅ Parser test passed!\n")
     return results
 
 
+def test_parse_cache(temp_dir):
+    """Test that the parse cache round-trips, notices edits and merges concurrent saves."""
+    print("🗃️  Testing Parse Cache...\n")
+    
+    cache_path = os.path.join(temp_dir, 'cache', 'parse_cache.pkl')
+    repos = {}
+    for name in ('cache_repo_a', 'cache_repo_b'):
+        repos[name] = os.path.join(temp_dir, name)
+        os.makedirs(repos[name])
+        with open(os.path.join(repos[name], 'signals.py'), 'w') as f:
+            f.write('def calculate_sma(prices, period):\n    return sum(prices[-period:]) / period\n')
+    repo_a, repo_b = repos['cache_repo_a'], repos['cache_repo_b']
+    
+    # Round trip: a second parser reads every file back from the saved cache
+    first = StrategyParser(max_workers=1, cache_path=cache_path).parse_repository(repo_a)
+    assert os.path.exists(cache_path), "Parse cache was not saved"
+    reloaded = StrategyParser(max_workers=1, cache_path=cache_path)
+    assert reloaded.parse_repository(repo_a) == first, "Cached parse differs from a fresh parse"
+    assert len(reloaded._recent) == first['files_parsed'], "Unchanged files were not cache hits"
+    
+    # Stale hash: an edited file is parsed again, not served from the cache
+    with open(os.path.join(repo_a, 'signals.py'), 'a') as f:
+        f.write('\ndef calculate_ema(prices, period):\n    return prices[-1]\n')
+    edited = reloaded.parse_repository(repo_a)
+    names = {indicator.name for indicator in edited['indicators']}
+    assert names == {'calculate_sma', 'calculate_ema'}, f"Edited file served stale results: {names}"
+    
+    # Concurrent merge: two parsers loaded before either saved keep both entries
+    left = StrategyParser(max_workers=1, cache_path=cache_path)
+    right = StrategyParser(max_workers=1, cache_path=cache_path)
+    os.rename(os.path.join(repo_b, 'signals.py'), os.path.join(repo_b, 'left.py'))
+    left.parse_repository(repo_b)
+    os.rename(os.path.join(repo_b, 'left.py'), os.path.join(repo_b, 'right.py'))
+    right.parse_repository(repo_b)
+    saved = StrategyParser(max_workers=1, cache_path=cache_path)._cache
+    assert {'left.py', 'right.py'} <= {rel_path for rel_path, _ in saved}, "A concurrent save was lost"
+    
+    # A cache that cannot be written is reported, not raised
+    blocked = StrategyParser(max_workers=1, cache_path=os.path.join(repo_b, 'right.py', 'cache.pkl'))
+    assert blocked.parse_repository(repo_b)['files_parsed'] == 1
+    
+    print(f"Cached Entries: {len(saved)}")
+    print("\n✅ Parse cache test passed!\n")
+
+
 def test_normalizer(parsed_results):
     """Test spec normalizer functionality."""
     print("📝 Testing Spec Normalizer...\n")
@@ -317,6 +562,27 @@ def test_normalizer(parsed_results):
     md_doc = normalizer.generate_markdown_doc(spec)
     print(f"\n  Generated Markdown: {len(md_doc)} characters")
     
+    # Without orjson, saved specs keep non-ASCII text unescaped, as orjson does
+    import moltbot_scout.normalizer as normalizer_module
+    unicode_spec = dict(spec, description='Стратегия — 動量')
+    real_orjson = normalizer_module.orjson
+    encoders = {'json': None}
+    if real_orjson is not None:
+        encoders['orjson'] = real_orjson
+    with tempfile.TemporaryDirectory() as spec_dir:
+        saved = {}
+        for name, module in encoders.items():
+            normalizer_module.orjson = module
+            try:
+                path = normalizer.save_spec(unicode_spec, os.path.join(spec_dir, f'{name}.json'))
+            finally:
+                normalizer_module.orjson = real_orjson
+            with open(path, 'rb') as f:
+                saved[name] = f.read()
+        assert 'Стратегия — 動量'.encode('utf-8') in saved['json'], "json fallback escaped non-ASCII text"
+        if 'orjson' in saved:
+            assert saved['json'] == saved['orjson'], "json fallback bytes differ from orjson"
+    
     print("\n✅ Normalizer test passed!\n")
     return spec
 
@@ -352,6 +618,60 @@ def test_indexer(spec):
         print("\n✅ Indexer test passed!\n")
 
 
+def test_indexer_log(spec):
+    """Test the indexer's delta log: crash replay, upserts, torn writes and compaction."""
+    print("📚 Testing Artifact Index Log...\n")
+    
+    def spec_with(strategies, indicators, issues):
+        variant = copy.deepcopy(spec)
+        variant['code_analysis']['summary']['total_strategies'] = strategies
+        variant['code_analysis']['summary']['total_indicators'] = indicators
+        variant['security']['total_issues'] = issues
+        return variant
+    
+    with tempfile.TemporaryDirectory() as temp_artifacts:
+        index_file = os.path.join(temp_artifacts, 'index.json')
+        
+        def open_indexer():
+            return ArtifactIndexer(artifacts_dir=temp_artifacts, index_file=index_file,
+                                   compact_ratio=10)
+        
+        # Replay after a crash: nothing was compacted and close() never ran
+        crashed = open_indexer()
+        crashed.add_repository('test/a', spec_with(2, 3, 1), 'a.json', 'a.md')
+        crashed.add_repository('test/b', spec_with(5, 1, 0), 'b.json', 'b.md')
+        assert not os.path.exists(index_file) and os.path.exists(crashed.log_file)
+        replayed = open_indexer()
+        assert replayed.exists
+        assert [r['name'] for r in replayed.index['repositories']] == ['test/a', 'test/b']
+        assert replayed.get_stats() == {'total_repositories': 2, 'total_strategies': 7,
+                                        'total_indicators': 4, 'total_security_issues': 1}
+        
+        # Upserting an existing name replaces it and backs out its old stats
+        replayed.add_repository('test/a', spec_with(1, 1, 4), 'a.json', 'a.md')
+        assert len(replayed.index['repositories']) == 2
+        assert replayed.index['repositories'][0]['strategies_count'] == 1
+        expected_stats = {'total_repositories': 2, 'total_strategies': 6,
+                          'total_indicators': 2, 'total_security_issues': 4}
+        assert replayed.get_stats() == expected_stats
+        
+        # A torn final line is dropped; the entries before it survive
+        with open(replayed.log_file, 'a') as f:
+            f.write('{"op": "upsert", "entry": {"name": "test/c", "strat')
+        torn = open_indexer()
+        assert torn.get_stats() == expected_stats
+        assert torn.get_repositories()[0]['strategies_count'] == 1
+        
+        # Compaction folds the log into index.json and removes the log
+        replayed.close()
+        assert os.path.exists(index_file) and not os.path.exists(replayed.log_file)
+        compacted = open_indexer()
+        assert compacted.get_stats() == expected_stats
+        assert compacted.index['repositories'] == replayed.index['repositories']
+    
+    print("\n✅ Index log test passed!\n")
+
+
 def test_config():
     """Test configuration system."""
     print("⚙️  Testing Configuration System...\n")
@@ -375,8 +695,33 @@ def test_config():
         config2 = Config(temp_config)
         assert config2.get('github.token') == 'test_token', "Config load failed"
         
+        # The flat key index stays in step with the nested config
+        def flat_of(tree):
+            return Config.from_dict(copy.deepcopy(tree))._flat
+        
+        config.set('output.extra.depth', 3)
+        assert config.get('output.extra') == {'depth': 3}
+        assert config.get('output.extra.depth') == 3
+        assert config._flat == flat_of(config.config), "Flat index out of step after set()"
+        from_dict = Config.from_dict(config.config)
+        assert from_dict.get('scoring.min_score') == config.config['scoring']['min_score']
+        assert from_dict._flat == config._flat, "Flat index differs after from_dict()"
+        assert config.get('missing.key', 'fallback') == 'fallback'
+        
+        # Reloads of an unchanged file come from the parse cache, as copies
+        hits = _read_config_file.cache_info().hits
+        config3 = Config(temp_config)
+        assert _read_config_file.cache_info().hits == hits + 1, "Config file was parsed again"
+        config3.set('github.token', 'changed')
+        assert Config(temp_config).get('github.token') == 'test_token', "Cached config was modified"
+        
+        # A changed file is parsed again
+        config3.save(temp_config)
+        assert Config(temp_config).get('github.token') == 'changed', "Stale cached config"
+        
         print("Config get/set: ✓")
         print("Config save/load: ✓")
+        print("Config flat index and file cache: ✓")
         print("\n✅ Configuration test passed!\n")
         
     finally:
@@ -398,10 +743,16 @@ def main():
         # Run tests
         test_config()
         test_scoring()
+        test_discovery_overlap()
+        test_discovery_cache(temp_dir)
         security_results = test_security_scanner(repo_path)
+        test_overlapping_patterns(temp_dir)
+        test_scan_workers(temp_dir)
         parsed_results = test_parser(repo_path)
+        test_parse_cache(temp_dir)
         spec = test_normalizer(parsed_results)
         test_indexer(spec)
+        test_indexer_log(spec)
     
     print("=" * 60)
     print("✅ All tests passed successfully!")